@@ -1,48 +1,119 @@
 """The Mono Amp (HTTP) Audio Amplifier integration."""
 from __future__ import annotations
-from typing import Sequence
+from typing import Awaitable, Collection, Sequence
 
 from datetime import timedelta
 import logging
 import asyncio
+import json
+import time
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers import device_registry as dr
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
     DataUpdateCoordinator,
     UpdateFailed,
 )
 
-import requests
-from .const import DOMAIN
+import aiohttp
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .const import (
+    AMP_PORT,
+    CONF_FULL_SYNC_POLLS,
+    CONF_IDLE_POLL_INTERVAL,
+    CONF_MAX_CONCURRENCY,
+    CONF_OFF_ZONE_POLL_INTERVAL,
+    CONF_PLAYLIST_TTL,
+    CONF_POLL_BUDGET,
+    CONF_POLL_INTERVAL,
+    CONF_WRITE_DEBOUNCE,
+    DEFAULT_FULL_SYNC_POLLS,
+    DEFAULT_IDLE_POLL_INTERVAL,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_MAX_TOTAL_REQUESTS,
+    DEFAULT_OFF_ZONE_POLL_INTERVAL,
+    DEFAULT_PLAYLIST_TTL,
+    DEFAULT_POLL_BUDGET,
+    DEFAULT_POLL_INTERVAL,
+    DEFAULT_WRITE_DEBOUNCE,
+    DOMAIN,
+    IDLE_AFTER,
+    KEYPAD_SAMPLE_SIZE,
+    ZONE_ACTIVE_WINDOW,
+)
+from .breaker import CircuitBreaker
+from .metrics import GatewayMetrics
+from .models import EMPTY_SNAPSHOT, AmpSnapshot, SourceList, ZoneState
+from .pianod import PianodHub
+from .request_queue import (
+    PRIORITY_COMMAND,
+    PRIORITY_POLL,
+    PRIORITY_REFRESH,
+    RequestQueue,
+)
+from .scheduler import async_get_scheduler
+from .snapshot import SnapshotStore
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS = ["media_player", "number"]
+PLATFORMS = ["media_player", "number", "sensor"]
+
+API_TIMEOUT = aiohttp.ClientTimeout(total=1)
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up House Audio Amplifier from a config entry."""
-    # hass.data[DOMAIN][entry.entry_id] = MyApi(...)
-    hass.data[DOMAIN] = {}
+    scheduler = async_get_scheduler(hass)
     api_lock = asyncio.Lock()
 
-    gateway = MonoAmpGateway(entry.data["host"])
+    gateway = MonoAmpGateway(
+        entry.data["host"],
+        async_get_clientsession(hass),
+        request_limiter=scheduler.request_limiter,
+        max_concurrency=entry.options.get(
+            CONF_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY
+        ),
+        write_debounce=entry.options.get(CONF_WRITE_DEBOUNCE, DEFAULT_WRITE_DEBOUNCE),
+        poll_budget=entry.options.get(CONF_POLL_BUDGET, DEFAULT_POLL_BUDGET),
+        full_sync_polls=entry.options.get(
+            CONF_FULL_SYNC_POLLS, DEFAULT_FULL_SYNC_POLLS
+        ),
+    )
+
+    snapshot = SnapshotStore(hass, entry.entry_id)
+    await snapshot.async_load()
 
     coordinator = MonoAmpDataUpdateCoordinator(
         hass,
         config_entry=entry,
         gateway=gateway,
         api_lock=api_lock,
+        snapshot=snapshot,
     )
 
     hass.data[DOMAIN][entry.entry_id] = {
         "coordinator": coordinator,
+        "snapshot": snapshot,
+        "pianod": PianodHub(
+            entry.data["host"],
+            async_get_clientsession(hass),
+            playlist_ttl=entry.options.get(CONF_PLAYLIST_TTL, DEFAULT_PLAYLIST_TTL),
+        ),
         "listener": entry.add_update_listener(async_update_listener),
     }
 
-    await coordinator.async_config_entry_first_refresh()
+    if snapshot.amp_state:
+        # Create the entities from the last known state and let live data
+        # reconcile in the background
+        gateway.restore(snapshot.amp_state)
+        coordinator.async_restore()
+        hass.async_create_task(coordinator.async_refresh())
+    else:
+        await coordinator.async_config_entry_first_refresh()
+
+    entry.async_on_unload(scheduler.async_register(coordinator))
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
@@ -56,39 +127,446 @@ async def async_update_listener(hass: HomeAssistant, entry: ConfigEntry):
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
 
-    await hass.config_entries.async_forward_entry_unload(entry, "media_player")
-    await hass.config_entries.async_forward_entry_unload(entry, "number")
+    await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
-    hass.data[DOMAIN].pop(entry.entry_id)
+    entry_data = hass.data[DOMAIN].pop(entry.entry_id)
+    entry_data["listener"]()
+    await entry_data["pianod"].async_close()
+    await entry_data["coordinator"].gateway.async_close()
 
     return True
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the stored snapshot of a deleted config entry."""
+    await SnapshotStore(hass, entry.entry_id).async_remove()
+
+
 class MonoAmpDataUpdateCoordinator(DataUpdateCoordinator):
-    """ The update coordinator for the MonoAmp integration """
-    def __init__(self, hass, *, gateway, config_entry, api_lock):
+    """ The update coordinator for the MonoAmp integration
+
+        Polls are not timed by the coordinator itself but by the domain's
+        PollScheduler, which reads poll_interval before every poll. api_lock
+        only keeps polls from overlapping, the gateway's request queue orders
+        them against commands.
+
+        Polling adapts to use: zones that are on or were commanded recently
+        are fetched every poll, powered-off zones only every
+        off_zone_poll_interval. poll_interval itself relaxes to the idle
+        interval once nobody has sent a command for a while and snaps back
+        on the next command.
+    """
+    def __init__(self, hass, *, gateway, config_entry, api_lock, snapshot=None):
         """Initialize the MonoAmp Data Update Coordinator."""
         self.config_entry = config_entry
         self.api_lock = api_lock
         self.gateway = gateway
+        self.snapshot: SnapshotStore | None = snapshot
+        self.current: AmpSnapshot = EMPTY_SNAPSHOT
+        self._changed: dict | None = None
+        self._keypad_refreshes: dict[int, asyncio.Task] = {}
+        self._available: bool = gateway.available
 
-        interval = timedelta(seconds=5)
+        options = config_entry.options
+        self._fast_interval = timedelta(
+            seconds=options.get(CONF_POLL_INTERVAL, DEFAULT_POLL_INTERVAL)
+        )
+        self._idle_interval = max(
+            self._fast_interval,
+            timedelta(
+                seconds=options.get(CONF_IDLE_POLL_INTERVAL, DEFAULT_IDLE_POLL_INTERVAL)
+            ),
+        )
+        self._off_zone_interval: float = options.get(
+            CONF_OFF_ZONE_POLL_INTERVAL, DEFAULT_OFF_ZONE_POLL_INTERVAL
+        )
+        # Startup counts as an interaction so the first minutes poll fast
+        self._last_interaction: float = time.monotonic()
+        self._zone_commanded: dict[int, float] = {}
+        self._zone_polled: dict[int, float] = {}
+        self.poll_interval: timedelta = self._fast_interval
         super().__init__(
             hass,
             _LOGGER,
-            name=DOMAIN,
-            update_interval=interval,
+            name=f"{DOMAIN} {gateway.host}",
+            update_interval=None,
         )
 
     async def _async_update_data(self):
         """Fetch data from the MonoAmp gateway."""
+        # If this refresh fails before the diff is computed every listener
+        # is notified, same as the stock coordinator
+        self._changed = None
+        start = time.monotonic()
+
+        skipped, due = self._off_zone_channels(start)
+        fetched: set[int] = set()
+
         try:
             async with self.api_lock:
-                await self.hass.async_add_executor_job(self.gateway.update)
+                fetched = await self.gateway.update(
+                    skip_channels=skipped, due_channels=due
+                )
         except Exception as error:
             _LOGGER.warning("MonoAmpError: %s", error)
 
-        return self.gateway.get_data()
+        self.gateway.metrics.record_poll(
+            time.monotonic() - start,
+            self.poll_interval.total_seconds(),
+        )
+
+        data = self.gateway.get_data()
+        if data is None:
+            raise UpdateFailed(f"No answer from the MonoAmp at {self.gateway.host}")
+
+        for chan in fetched:
+            self._zone_polled[chan] = start
+
+        self._index_data(data)
+        self._apply_backoff()
+
+        if self.snapshot is not None and self.gateway.available and self._changed != {}:
+            self.snapshot.async_update(amp_state=data)
+
+        return data
+
+    @callback
+    def async_restore(self) -> None:
+        """Publish the restored gateway state before the first poll"""
+        self._async_publish()
+
+    def _off_zone_channels(self, now: float) -> tuple[set[int], set[int]]:
+        """Sorts the powered-off zones by their slow poll cadence
+
+        Zones that are on, stale or were commanded recently are in neither set.
+
+        Returns:
+            tuple: the channels not due for a poll and those that are due
+        """
+        skipped, due = set(), set()
+
+        for zone in self.current.zones.values():
+            if (
+                zone.power
+                or zone.stale
+                or now - self._zone_commanded.get(zone.channel, -ZONE_ACTIVE_WINDOW)
+                < ZONE_ACTIVE_WINDOW
+            ):
+                continue
+
+            polled = self._zone_polled.get(zone.channel, -self._off_zone_interval)
+            if now - polled < self._off_zone_interval:
+                skipped.add(zone.channel)
+            else:
+                due.add(zone.channel)
+
+        return skipped, due
+
+    @callback
+    def async_note_interaction(self, chan: int) -> None:
+        """Record a user command so polling speeds up again
+
+        Args:
+            chan (int): the keypad channel the command targets
+        """
+        now = time.monotonic()
+        self._last_interaction = now
+        self._zone_commanded[chan] = now
+
+        if self.gateway.available and self.poll_interval > self._fast_interval:
+            self.poll_interval = self._fast_interval
+            async_get_scheduler(self.hass).async_reschedule(self)
+
+    def _apply_backoff(self) -> None:
+        """Pick the next poll interval
+
+        While the amp is unreachable the next poll is scheduled for when the
+        circuit breaker lets its probe through. Otherwise polls run at the
+        fast interval, relaxed to the idle one after IDLE_AFTER seconds
+        without a command. Every entity is notified when availability
+        changes.
+        """
+        breaker = self.gateway.breaker
+
+        if time.monotonic() - self._last_interaction < IDLE_AFTER:
+            interval = self._fast_interval
+        else:
+            interval = self._idle_interval
+
+        if breaker.closed:
+            self.poll_interval = interval
+        else:
+            self.poll_interval = max(interval, timedelta(seconds=breaker.retry_in))
+
+        if self._available != self.gateway.available:
+            self._available = self.gateway.available
+            self._changed = None
+
+    async def async_command(self, chan: int, values: dict, request: Awaitable):
+        """Run a command with its result applied optimistically
+
+        The values are published to the keypad right away, then the keypad
+        is re-fetched once the command completes to confirm them. If the
+        command failed and the keypad could not be re-fetched the values are
+        rolled back.
+
+        Args:
+            chan (int): the keypad channel the command targets
+            values (dict): the keypad fields the command is expected to set
+            request (Awaitable): the gateway request sending the command
+
+        Returns:
+            the result of the request
+        """
+        self.async_note_interaction(chan)
+
+        previous = self.gateway.set_keypad_values(chan, values)
+        if previous is not None:
+            self._async_publish()
+
+        ret = await request
+        failed = "" in ret if isinstance(ret, list) else ret == ""
+
+        if await self.async_refresh_keypad(chan) is None and failed:
+            self._async_rollback(chan, values, previous)
+
+        return ret
+
+    @callback
+    def _async_rollback(self, chan: int, values: dict, previous: dict | None) -> None:
+        """Undo optimistic values of a failed command that could not be
+        confirmed"""
+        if previous is None:
+            return
+
+        current = self.gateway.get_keypad(chan) or {}
+        # Only undo fields no later command has changed since
+        self.gateway.set_keypad_values(
+            chan,
+            {
+                key: previous.get(key)
+                for key, value in values.items()
+                if current.get(key) == value
+            },
+        )
+        self._async_publish()
+
+    async def async_command_zones(
+        self, values: dict[int, dict], full_poll: bool = False
+    ) -> dict[int, bool]:
+        """Write values to several zones at once
+
+        The values are published optimistically and every zone is written
+        concurrently, bounded by the gateway's request queue. Each zone's
+        keypad is then re-fetched to confirm them, or with full_poll a single
+        full poll confirms every zone at the end.
+
+        Args:
+            values (dict): keypad fields to set keyed by channel
+            full_poll (bool, optional): confirm with one full poll
+
+        Returns:
+            dict: True per channel if all its writes succeeded
+        """
+        values = {
+            chan: zone_values for chan, zone_values in values.items() if zone_values
+        }
+        if not values:
+            return {}
+
+        previous = {}
+        for chan, zone_values in values.items():
+            self.async_note_interaction(chan)
+            previous[chan] = self.gateway.set_keypad_values(chan, zone_values)
+        self._async_publish()
+
+        results = await asyncio.gather(
+            *(
+                self._async_write_zone(chan, zone_values)
+                if full_poll
+                else self._async_confirm_zone(chan, zone_values, previous[chan])
+                for chan, zone_values in values.items()
+            )
+        )
+
+        if full_poll:
+            self.gateway.request_full_sync()
+            await self.async_refresh()
+
+        return dict(zip(values, results))
+
+    async def _async_confirm_zone(
+        self, chan: int, values: dict, previous: dict | None
+    ) -> bool:
+        """Write the values of one zone and re-fetch its keypad, rolling
+        back if the writes failed and the keypad could not be fetched"""
+        ok = await self._async_write_zone(chan, values)
+
+        if await self.async_refresh_keypad(chan) is None and not ok:
+            self._async_rollback(chan, values, previous)
+
+        return ok
+
+    async def _async_write_zone(self, chan: int, values: dict) -> bool:
+        """Write the values of one zone, set while the zone is powered
+
+        Returns:
+            bool: True if every write succeeded
+        """
+        power = values.get("PR")
+        settings = {key: value for key, value in values.items() if key != "PR"}
+        results = []
+
+        if power == 1:
+            results.append(await self.gateway.async_set_value(chan, "PR", power))
+        if settings:
+            results.extend(await self.gateway.async_set_values(chan, settings))
+        if power == 0:
+            results.append(await self.gateway.async_set_value(chan, "PR", power))
+
+        return "" not in results
+
+    async def async_refresh_keypad(self, chan: int):
+        """Re-fetch a single keypad and publish it without a full poll
+
+        Concurrent refreshes of the same keypad share one request.
+
+        Returns:
+            dict: the keypad data, None if it could not be fetched
+        """
+        task = self._keypad_refreshes.get(chan)
+        if task is None:
+            task = self.hass.async_create_task(self._async_refresh_keypad(chan))
+            self._keypad_refreshes[chan] = task
+            task.add_done_callback(lambda _: self._keypad_refreshes.pop(chan, None))
+
+        return await asyncio.shield(task)
+
+    async def _async_refresh_keypad(self, chan: int):
+        """Fetch one keypad and publish the result"""
+        keypad = await self.gateway.async_update_keypad(chan)
+        if keypad is not None:
+            self._async_publish()
+
+        return keypad
+
+    @callback
+    def _async_publish(self) -> None:
+        """Publish the gateway data to the listeners outside of a poll"""
+        data = self.gateway.get_data()
+        self._index_data(data)
+        self.async_set_updated_data(data)
+
+    @property
+    def keypads(self) -> dict:
+        """Returns the keypads of the current snapshot keyed by zone"""
+        return self.current.keypads
+
+    @property
+    def zones(self) -> dict[int, ZoneState]:
+        """Returns the parsed zones of the current snapshot keyed by zone"""
+        return self.current.zones
+
+    @property
+    def sources(self) -> SourceList:
+        """Returns the selectable sources of the current snapshot"""
+        return self.current.sources
+
+    def _index_data(self, data) -> None:
+        """Build the next snapshot from data, record what changed since the
+        current one and swap it in"""
+        current = self.current
+        keypads = self._build_keypad_index(data)
+        sources = data.get("Sources", []) if data else []
+
+        if current.data is not None and current.data.get("Sources") == sources:
+            self._changed = self._diff_keypads(current.keypads, keypads)
+            source_list = current.sources
+            # Only the zones whose keypad changed need to be parsed again
+            zones = {
+                zone: current.zones[zone]
+                if zone in current.zones and zone not in self._changed
+                else ZoneState.from_keypad(keypad, sources)
+                for zone, keypad in keypads.items()
+            }
+        else:
+            self._changed = None
+            source_list = SourceList.from_sources(sources)
+            zones = {
+                zone: ZoneState.from_keypad(keypad, sources)
+                for zone, keypad in keypads.items()
+            }
+
+        self.current = AmpSnapshot(
+            data=data, keypads=keypads, zones=zones, sources=source_list
+        )
+
+    @staticmethod
+    def _diff_keypads(old: dict, new: dict) -> dict:
+        """Compare two keypad indexes
+
+        Returns:
+            dict: changed fields keyed by zone, None marks a zone that appeared
+            or disappeared and needs a full refresh
+        """
+        changed = {}
+
+        for zone in old.keys() - new.keys():
+            changed[zone] = None
+
+        for zone, keypad in new.items():
+            old_keypad = old.get(zone)
+            if old_keypad is None:
+                changed[zone] = None
+            elif old_keypad is not keypad:
+                fields = {
+                    key
+                    for key in keypad.keys() | old_keypad.keys()
+                    if keypad.get(key) != old_keypad.get(key)
+                }
+                if fields:
+                    changed[zone] = fields
+
+        return changed
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify only the entities whose watched fields changed."""
+        changed = self._changed
+        self._changed = None
+
+        if changed is None:
+            super().async_update_listeners()
+            return
+
+        for update_callback, context in list(self._listeners.values()):
+            if self._context_changed(context, changed):
+                update_callback()
+
+    @staticmethod
+    def _context_changed(context, changed: dict) -> bool:
+        """Returns True if a listener context is affected by the changes"""
+        if context is None:
+            return True
+
+        zone, fields = context
+        if zone not in changed:
+            return False
+
+        changed_fields = changed[zone]
+        return (
+            changed_fields is None
+            or not fields
+            or not changed_fields.isdisjoint(fields)
+        )
+
+    @staticmethod
+    def _build_keypad_index(data) -> dict:
+        """Index the keypads by zone so entities can look them up in O(1)"""
+        if not data or "Keypads" not in data:
+            return {}
+
+        return {kp["ZN"]: kp for kp in data["Keypads"] if isinstance(kp, dict)}
 
 
 class MonoAmpEntity(CoordinatorEntity):
@@ -97,9 +575,18 @@ class MonoAmpEntity(CoordinatorEntity):
     Args:
         CoordinatorEntity (CoordinatorEntity): object of type CoordinatorEntity from Home Assistant
     """
-    def __init__(self, coordinator, data_key, enabled=True):
+    # Keypad fields this entity renders, an empty tuple listens to all of
+    # them and None to every refresh, keypad changes or not
+    _watched_fields: tuple | None = ()
+
+    def __init__(self, coordinator, data_key, enabled=True, fields=None):
         """Initialize of the entity."""
-        super().__init__(coordinator)
+        if fields is None:
+            fields = self._watched_fields
+
+        super().__init__(
+            coordinator, context=None if fields is None else (data_key, tuple(fields))
+        )
         self._data_key = data_key
         self._enabled_default = enabled
 
@@ -126,6 +613,22 @@ class MonoAmpEntity(CoordinatorEntity):
         """Entity Unique ID."""
         return f"{self.mac}_{self._data_key}"
 
+    @property
+    def available(self) -> bool:
+        """Entities keep their last state but are unavailable while the amp
+        cannot be reached."""
+        return super().available and self.gateway.available
+
+    @property
+    def keypad(self):
+        """Return the keypad data for this entity's zone."""
+        return self.coordinator.keypads.get(self._data_key)
+
+    @property
+    def zone_state(self) -> ZoneState | None:
+        """Return the parsed state of this entity's zone."""
+        return self.coordinator.zones.get(self._data_key)
+
     @property
     def config_data(self):
         """Shortcut for config data."""
@@ -152,34 +655,410 @@ class MonoAmpEntity(CoordinatorEntity):
         }
 
 
+class _PendingWrite:
+    """A property write waiting to be sent, later values replace the queued one"""
+
+    def __init__(self, value) -> None:
+        self.value = value
+        self.waiters: list[asyncio.Future] = []
+
+
 class MonoAmpGateway:
     """ 
         class:  MonoAmpGateway
+
+        All requests are sent from the event loop through a shared aiohttp
+        session, so connections to the amp are pooled and kept alive. They
+        pass through one prioritized queue that holds the amp to
+        max_concurrency requests in flight, commands first.
+
+        amp_state is double buffered: polls and commands build the next
+        state aside and publish it with one reference swap.
+
+        Polls fingerprint the AmpState payload. While it is unchanged only a
+        rotating sample of keypads is fetched, plus stale ones, and every
+        full_sync_polls polls all of them are. A keypad that answers with
+        the data already published keeps its dict, so nothing downstream
+        sees a change.
     """
-    def __init__(self, host) -> None:
+    def __init__(
+        self,
+        host,
+        session: aiohttp.ClientSession,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        write_debounce: float = DEFAULT_WRITE_DEBOUNCE,
+        poll_budget: float = DEFAULT_POLL_BUDGET,
+        request_limiter: asyncio.Semaphore | None = None,
+        full_sync_polls: int = DEFAULT_FULL_SYNC_POLLS,
+        port: int = AMP_PORT,
+    ) -> None:
         self.host: str = host
-        self.api_endpoint: str = "http://" + self.host + ":50230/api"
-        self.amp_state: str = None
+        self.api_endpoint: str = f"http://{self.host}:{port}/api"
+        # Never edited in place, every change publishes a new dict
+        self.amp_state: dict | None = None
+        self._session: aiohttp.ClientSession = session
+        self._queue = RequestQueue(max_concurrency)
+        self.write_debounce: float = write_debounce
+        self._pending_writes: dict[tuple, _PendingWrite] = {}
+        self._write_tasks: set[asyncio.Task] = set()
+        self.metrics = GatewayMetrics()
+        self.breaker = CircuitBreaker()
+        self.poll_budget: float = poll_budget
+        self.full_sync_polls: int = full_sync_polls
+        self._amp_fingerprint: int | None = None
+        self._quiet_polls: int = 0
+        self._sample_cursor: int = 0
+        # Shared by all gateways to cap the requests in flight to every amp
+        self._request_limiter = request_limiter or asyncio.Semaphore(
+            DEFAULT_MAX_TOTAL_REQUESTS
+        )
+
+    async def async_set_value(self, channel, prop: str, value) -> str:
+        """Writes a zone property, coalescing bursts of writes
+
+        Writes to the same channel and property that arrive within the
+        debounce window, or while an earlier write is in flight, are merged
+        and only the latest value is sent.
+
+        Args:
+            channel (int): the amp channel
+            prop (str): the property, e.g. VO
+            value (int): the new value
+
+        Returns:
+            str: the result of the request that carried the value
+        """
+        key = (channel, prop)
+        waiter = asyncio.get_running_loop().create_future()
+
+        pending = self._pending_writes.get(key)
+        if pending is None:
+            pending = self._pending_writes[key] = _PendingWrite(value)
+            task = asyncio.get_running_loop().create_task(
+                self._async_flush_writes(key)
+            )
+            self._write_tasks.add(task)
+            task.add_done_callback(self._write_tasks.discard)
+        else:
+            pending.value = value
+
+        pending.waiters.append(waiter)
+        return await waiter
+
+    async def async_set_values(self, channel, values: dict) -> list:
+        """Writes several properties of a zone concurrently
 
-    def update(self) -> None:
-        """Updates the state of the Class"""
-        result_json = self.api_request("AmpState")
+        Args:
+            channel (int): the amp channel
+            values (dict): new values keyed by property
+
+        Returns:
+            list: the results of the writes
+        """
+        return await asyncio.gather(
+            *(
+                self.async_set_value(channel, prop, value)
+                for prop, value in values.items()
+            )
+        )
+
+    async def _async_flush_writes(self, key: tuple) -> None:
+        """Sends the latest queued value for a property until none is left"""
+        channel, prop = key
+        pending = self._pending_writes[key]
+
+        try:
+            while pending.waiters:
+                if self.write_debounce:
+                    await asyncio.sleep(self.write_debounce)
+
+                value, waiters = pending.value, pending.waiters
+                pending.waiters = []
+
+                ret = await self.api_request(
+                    "Value", {"Channel": channel, "Property": prop, "Value": value}
+                )
+
+                for waiter in waiters:
+                    if not waiter.done():
+                        waiter.set_result(ret)
+        finally:
+            self._pending_writes.pop(key, None)
+            for waiter in pending.waiters:
+                if not waiter.done():
+                    waiter.cancel()
+
+    async def async_close(self) -> None:
+        """Cancels the writes still waiting to be sent"""
+        tasks = list(self._write_tasks)
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        # A task cancelled before it started never released its waiters
+        for pending in self._pending_writes.values():
+            for waiter in pending.waiters:
+                waiter.cancel()
+        self._pending_writes.clear()
+
+    async def update(
+        self,
+        skip_channels: Collection[int] = (),
+        due_channels: Collection[int] = (),
+    ) -> set[int]:
+        """Updates the state of the Class
+
+        Args:
+            skip_channels (Collection[int], optional): keypads to leave out of
+                this poll unless it is a full sync, they keep their last
+                known data
+            due_channels (Collection[int], optional): keypads fetched even by
+                a quiet poll
+
+        Returns:
+            set: the channels whose keypad was fetched
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.poll_budget
+
+        # While the breaker is open this fails fast, the first request let
+        # through afterwards is this cheap AmpState probe
+        result_json = await self.api_request("AmpState", priority=PRIORITY_POLL)
 
         if result_json != "":
-            self.amp_state = result_json
+            previous = self.amp_state["Keypads"] if self.amp_state else []
+            count = result_json["KeypadCount"]
+
+            fingerprint = self._fingerprint(result_json)
+            quiet = (
+                fingerprint == self._amp_fingerprint
+                and self._quiet_polls + 1 < self.full_sync_polls
+            )
+            self._amp_fingerprint = fingerprint
 
-            self.amp_state["Keypads"] = []
-            for kp in range(0, self.amp_state["KeypadCount"]):
-                self.amp_state["Keypads"].insert(
-                    kp, self.api_request("keypad", args={"chan": kp})
+            if quiet:
+                self._quiet_polls += 1
+                self.metrics.quiet_polls += 1
+                channels = self._sample_channels(
+                    [
+                        chan
+                        for chan in range(0, count)
+                        if chan not in skip_channels or chan >= len(previous)
+                    ],
+                    previous,
+                    due_channels,
                 )
+                self.metrics.keypads_skipped += count - len(channels)
+            else:
+                # A full sync is the safety net, it fetches every keypad
+                self._quiet_polls = 0
+                channels = list(range(0, count))
+
+            tasks = {
+                chan: asyncio.ensure_future(self._fetch_keypad(chan))
+                for chan in channels
+            }
+            if tasks:
+                _, pending = await asyncio.wait(
+                    tasks.values(), timeout=max(0, deadline - loop.time())
+                )
+                for task in pending:
+                    task.cancel()
+                if pending:
+                    self.metrics.deadline_misses += len(pending)
+                    _LOGGER.debug(
+                        "MonoAmpGateway - %d keypads missed the poll deadline",
+                        len(pending),
+                    )
+
+            # Results are placed by channel regardless of completion order,
+            # skipped keypads carry over unchanged
+            keypads = []
+            for chan in range(0, result_json["KeypadCount"]):
+                task = tasks.get(chan)
+                if task is None:
+                    keypads.append(previous[chan])
+                elif task.done() and not task.cancelled():
+                    keypads.append(self._reuse_keypad(chan, task.result(), previous))
+                else:
+                    keypads.append(None)
+
+            # A sampled keypad changed although AmpState did not, so the
+            # fingerprint cannot be trusted: sync everything next poll
+            if quiet and any(
+                self._drifted(previous[chan], keypads[chan])
+                for chan in tasks
+                if chan < len(previous)
+            ):
+                self.metrics.drift_resyncs += 1
+                self._amp_fingerprint = None
 
-    def api_request(self, request_id, args=None) -> str:
+            # Keep serving the last known keypad, flagged stale, when a fetch
+            # failed or missed the deadline
+            for chan, keypad in enumerate(keypads):
+                if not isinstance(keypad, dict) and chan < len(previous):
+                    if isinstance(previous[chan], dict):
+                        keypads[chan] = {**previous[chan], "stale": True}
+                    else:
+                        keypads[chan] = previous[chan]
+
+            # Publish with a single swap, readers keep the state they hold
+            self.amp_state = {**result_json, "Keypads": keypads}
+
+            return {
+                chan
+                for chan, task in tasks.items()
+                if task.done()
+                and not task.cancelled()
+                and isinstance(task.result(), dict)
+            }
+
+        return set()
+
+    def request_full_sync(self) -> None:
+        """Makes the next poll fetch every keypad, however quiet AmpState is"""
+        self._amp_fingerprint = None
+
+    def _sample_channels(
+        self, channels: list[int], previous: list, due_channels: Collection[int]
+    ) -> list[int]:
+        """Picks the keypads fetched by a quiet poll
+
+        Due, stale and unknown keypads are always fetched, the others in turn.
+        """
+        sample = [
+            chan
+            for chan in channels
+            if chan in due_channels
+            or chan >= len(previous)
+            or not isinstance(previous[chan], dict)
+            or previous[chan].get("stale")
+        ]
+        rest = [chan for chan in channels if chan not in sample]
+
+        if rest:
+            start = self._sample_cursor % len(rest)
+            picked = (rest[start:] + rest[:start])[:KEYPAD_SAMPLE_SIZE]
+            self._sample_cursor = start + len(picked)
+            sample.extend(picked)
+
+        return sample
+
+    @staticmethod
+    def _reuse_keypad(chan: int, keypad, previous: list):
+        """Returns the published keypad if a fetch returned the same data"""
+        if chan < len(previous) and keypad == previous[chan]:
+            return previous[chan]
+
+        return keypad
+
+    @staticmethod
+    def _drifted(previous, keypad) -> bool:
+        """Returns True if a fresh keypad fetch differs from the fresh data
+        published before it"""
+        return (
+            isinstance(previous, dict)
+            and isinstance(keypad, dict)
+            and not previous.get("stale")
+            and not keypad.get("stale")
+            and keypad is not previous
+        )
+
+    @staticmethod
+    def _fingerprint(payload) -> int:
+        """Returns a fingerprint of a JSON payload"""
+        return hash(json.dumps(payload, sort_keys=True))
+
+    async def async_update_keypad(self, chan: int):
+        """Re-fetches one keypad into amp_state
+
+        Args:
+            chan (int): the keypad channel
+
+        Returns:
+            dict: the keypad data, None if it could not be fetched
+        """
+        if self.amp_state is None or not 0 <= chan < len(self.amp_state["Keypads"]):
+            return None
+
+        keypad = await self._fetch_keypad(chan, PRIORITY_REFRESH)
+        if not isinstance(keypad, dict):
+            return None
+
+        self._replace_keypad(chan, keypad)
+
+        return keypad
+
+    def get_keypad(self, chan: int):
+        """Returns the keypad data for a channel, None if unknown"""
+        if self.amp_state is None or not 0 <= chan < len(self.amp_state["Keypads"]):
+            return None
+
+        keypad = self.amp_state["Keypads"][chan]
+        return keypad if isinstance(keypad, dict) else None
+
+    def set_keypad_values(self, chan: int, values: dict):
+        """Sets keypad fields ahead of the amp confirming them
+
+        Args:
+            chan (int): the keypad channel
+            values (dict): the fields to set
+
+        Returns:
+            dict: the keypad that was replaced, None if the channel is unknown
+        """
+        previous = self.get_keypad(chan)
+        if previous is None:
+            return None
+
+        self._replace_keypad(chan, {**previous, **values})
+        return previous
+
+    def restore(self, amp_state: dict) -> None:
+        """Seeds the state from a stored snapshot, every keypad flagged stale
+
+        Args:
+            amp_state (dict): a previously fetched AmpState with its keypads
+        """
+        self.amp_state = {
+            **amp_state,
+            "Keypads": [
+                {**keypad, "stale": True} if isinstance(keypad, dict) else keypad
+                for keypad in amp_state.get("Keypads", [])
+            ],
+        }
+
+    def _replace_keypad(self, chan: int, keypad: dict) -> None:
+        """Publish a new state instead of editing the one readers already hold"""
+        keypads = list(self.amp_state["Keypads"])
+        keypads[chan] = keypad
+        self.amp_state = {**self.amp_state, "Keypads": keypads}
+
+    async def _fetch_keypad(self, chan: int, priority: int = PRIORITY_POLL) -> str:
+        """Fetch a single keypad
+
+        Args:
+            chan (int): the keypad channel
+            priority (int, optional): the queue priority of the request
+
+        Returns:
+            str: the keypad data
+        """
+        return await self.api_request("keypad", args={"chan": chan}, priority=priority)
+
+    async def api_request(
+        self, request_id, args=None, priority: int = PRIORITY_COMMAND
+    ) -> str:
         """Sends an API request to the MonoAmp Gateway
 
+        Reads below command priority share a request with an identical one
+        still waiting in the queue.
+
         Args:
             request_id (str): the request_id
             args (str, optional): Additional Arg to send. Defaults to None.
+            priority (int, optional): the queue priority. Defaults to a command.
 
         Returns:
             str: the result of the request.
@@ -187,25 +1066,86 @@ class MonoAmpGateway:
         if args is None:
             args = {}
 
+        key = None
+        if priority != PRIORITY_COMMAND:
+            key = (request_id, tuple(sorted(args.items())))
+
+        queued_at = time.monotonic()
+        return await self._queue.async_submit(
+            lambda: self._async_send(request_id, args, queued_at), priority, key
+        )
+
+    async def _async_send(self, request_id, args: dict, queued_at: float) -> str:
+        """Sends a request once the queue gave it a slot"""
+        self.metrics.queue_wait.record(time.monotonic() - queued_at)
+
+        if not self.breaker.allow_request():
+            self.metrics.breaker_rejections += 1
+            return ""
+
         ret = None
+        failed = True
+        cancelled = False
+        start = time.monotonic()
 
         try:
-            ret = requests.get(
-                self.api_endpoint + "/" + request_id, params=args, timeout=1
+            async with self._request_limiter:
+                start = time.monotonic()
+                async with self._session.get(
+                    self.api_endpoint + "/" + request_id,
+                    params={key: str(value) for key, value in args.items()},
+                    timeout=API_TIMEOUT,
+                ) as response:
+                    ret = await response.json(content_type=None)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        except asyncio.TimeoutError:
+            self._log_failure("%s timed out", request_id)
+            self.metrics.record_request(
+                request_id, time.monotonic() - start, timeout=True
             )
-
-            ret = ret.json()
+            ret = ""
         except Exception as ex:
-            _LOGGER.error("MonoAmpGateway - api_request: %s", ex)
+            self._log_failure("%s", ex)
+            self.metrics.record_request(
+                request_id, time.monotonic() - start, error=True
+            )
             ret = ""
+        else:
+            failed = False
+            self.metrics.record_request(request_id, time.monotonic() - start)
+            if self.breaker.record_success():
+                _LOGGER.info("MonoAmpGateway - %s is reachable again", self.host)
+        finally:
+            # A request cancelled at the poll deadline says nothing about the
+            # amp being down, unless it was the probe of a half-open breaker
+            if cancelled and self.breaker.closed:
+                failed = False
+            if failed and self.breaker.record_failure():
+                _LOGGER.warning(
+                    "MonoAmpGateway - %s is unreachable, backing off", self.host
+                )
 
         return ret
 
-    def get_data(self) -> str:
+    def _log_failure(self, msg: str, *args) -> None:
+        """Logs a failed request, quietly once the breaker has opened"""
+        if self.breaker.closed:
+            _LOGGER.error("MonoAmpGateway - api_request: " + msg, *args)
+        else:
+            _LOGGER.debug("MonoAmpGateway - api_request: " + msg, *args)
+
+    @property
+    def available(self) -> bool:
+        """Returns True unless the amp is considered unreachable"""
+        return self.breaker.closed
+
+    def get_data(self) -> dict | None:
         """Return the data in amp_state
 
         Returns:
-            str: data
+            dict: data
         """
         return self.amp_state
 
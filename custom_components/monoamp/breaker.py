@@ -0,0 +1,109 @@
+""" Circuit breaker guarding the requests to an unreachable amp """
+from __future__ import annotations
+
+import time
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+        class:  CircuitBreaker
+
+        Opens after failure_threshold consecutive failures. While open every
+        request fails fast until the reset timeout elapses, then a single
+        probe is let through (half-open). A successful probe closes the
+        breaker, a failed one re-opens it with the timeout doubled, up to
+        max_reset_timeout.
+    """
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        reset_timeout: float = 5,
+        max_reset_timeout: float = 300,
+    ) -> None:
+        self.failure_threshold: int = failure_threshold
+        self.min_reset_timeout: float = reset_timeout
+        self.max_reset_timeout: float = max_reset_timeout
+        self.reset_timeout: float = reset_timeout
+        self.state: str = STATE_CLOSED
+        self.failures: int = 0
+        self.opened: int = 0
+        self._retry_at: float = 0
+
+    @property
+    def closed(self) -> bool:
+        """Returns True if requests flow normally"""
+        return self.state == STATE_CLOSED
+
+    @property
+    def retry_in(self) -> float:
+        """Returns the seconds left until the next probe is allowed"""
+        if self.state != STATE_OPEN:
+            return 0
+
+        return max(0, self._retry_at - time.monotonic())
+
+    def allow_request(self) -> bool:
+        """Returns True if a request may be sent now
+
+        Moves an open breaker to half-open once its timeout elapsed, the
+        request that gets True is then the probe.
+        """
+        if self.state == STATE_CLOSED:
+            return True
+
+        if self.state == STATE_OPEN and time.monotonic() >= self._retry_at:
+            self.state = STATE_HALF_OPEN
+            return True
+
+        return False
+
+    def record_success(self) -> bool:
+        """Records a successful request
+
+        Returns:
+            bool: True if this closed the breaker
+        """
+        was_closed = self.closed
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.reset_timeout = self.min_reset_timeout
+        return not was_closed
+
+    def record_failure(self) -> bool:
+        """Records a failed request
+
+        Returns:
+            bool: True if this opened the breaker from closed
+        """
+        self.failures += 1
+
+        if self.state == STATE_HALF_OPEN:
+            self.reset_timeout = min(self.reset_timeout * 2, self.max_reset_timeout)
+            self._open()
+            return False
+
+        if self.state == STATE_CLOSED and self.failures >= self.failure_threshold:
+            self._open()
+            return True
+
+        return False
+
+    def _open(self) -> None:
+        """Opens the breaker for reset_timeout seconds"""
+        self.state = STATE_OPEN
+        self.opened += 1
+        self._retry_at = time.monotonic() + self.reset_timeout
+
+    def as_dict(self) -> dict:
+        """Returns the breaker state in a JSON friendly form"""
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "opened": self.opened,
+            "reset_timeout": self.reset_timeout,
+            "retry_in": round(self.retry_in, 1),
+        }
@@ -7,11 +7,32 @@ from typing import Any
 import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
-
-from .const import DOMAIN
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .const import (
+    CONF_FULL_SYNC_POLLS,
+    CONF_IDLE_POLL_INTERVAL,
+    CONF_MAX_CONCURRENCY,
+    CONF_OFF_ZONE_POLL_INTERVAL,
+    CONF_PIANOD_PUSH,
+    CONF_PLAYLIST_TTL,
+    CONF_POLL_BUDGET,
+    CONF_POLL_INTERVAL,
+    CONF_WRITE_DEBOUNCE,
+    DEFAULT_FULL_SYNC_POLLS,
+    DEFAULT_IDLE_POLL_INTERVAL,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_OFF_ZONE_POLL_INTERVAL,
+    DEFAULT_PIANOD_PUSH,
+    DEFAULT_PLAYLIST_TTL,
+    DEFAULT_POLL_BUDGET,
+    DEFAULT_POLL_INTERVAL,
+    DEFAULT_WRITE_DEBOUNCE,
+    DOMAIN,
+)
 
 from . import MonoAmpGateway
 
@@ -23,6 +44,56 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
     }
 )
 
+# option: (default, validator)
+OPTIONS = {
+    CONF_MAX_CONCURRENCY: (
+        DEFAULT_MAX_CONCURRENCY,
+        vol.All(vol.Coerce(int), vol.Range(min=1, max=16)),
+    ),
+    CONF_PIANOD_PUSH: (
+        DEFAULT_PIANOD_PUSH,
+        bool,
+    ),
+    CONF_PLAYLIST_TTL: (
+        DEFAULT_PLAYLIST_TTL,
+        vol.All(vol.Coerce(int), vol.Range(min=0)),
+    ),
+    CONF_WRITE_DEBOUNCE: (
+        DEFAULT_WRITE_DEBOUNCE,
+        vol.All(vol.Coerce(float), vol.Range(min=0, max=2)),
+    ),
+    CONF_POLL_BUDGET: (
+        DEFAULT_POLL_BUDGET,
+        vol.All(vol.Coerce(float), vol.Range(min=1, max=60)),
+    ),
+    CONF_POLL_INTERVAL: (
+        DEFAULT_POLL_INTERVAL,
+        vol.All(vol.Coerce(int), vol.Range(min=1, max=300)),
+    ),
+    CONF_IDLE_POLL_INTERVAL: (
+        DEFAULT_IDLE_POLL_INTERVAL,
+        vol.All(vol.Coerce(int), vol.Range(min=1, max=3600)),
+    ),
+    CONF_OFF_ZONE_POLL_INTERVAL: (
+        DEFAULT_OFF_ZONE_POLL_INTERVAL,
+        vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
+    ),
+    CONF_FULL_SYNC_POLLS: (
+        DEFAULT_FULL_SYNC_POLLS,
+        vol.All(vol.Coerce(int), vol.Range(min=1, max=1000)),
+    ),
+}
+
+
+def options_schema(options) -> vol.Schema:
+    """Returns the options form, filled in with the current values"""
+    return vol.Schema(
+        {
+            vol.Optional(key, default=options.get(key, default)): validator
+            for key, (default, validator) in OPTIONS.items()
+        }
+    )
+
 
 class PlaceholderHub:
     """Placeholder class to make tests pass.
@@ -46,11 +117,11 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
     Data has the keys from STEP_USER_DATA_SCHEMA with values provided by the user.
     """
 
-    gw = MonoAmpGateway(data["host"])
+    gw = MonoAmpGateway(data["host"], async_get_clientsession(hass))
 
-    ret = await hass.async_add_executor_job(gw.api_request, "AmpState")
+    ret = await gw.api_request("AmpState")
 
-    if ret is None:
+    if not ret:
         raise CannotConnect
 
     return {"title": "Whole Home Audio Amplifier"}
@@ -61,6 +132,14 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> OptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return OptionsFlowHandler(config_entry)
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -72,6 +151,9 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         errors = {}
 
+        await self.async_set_unique_id(user_input["host"])
+        self._abort_if_unique_id_configured()
+
         try:
             info = await validate_input(self.hass, user_input)
         except CannotConnect:
@@ -89,6 +171,25 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         )
 
 
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle the tuning options of an amp."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize options flow."""
+        self._entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        return self.async_show_form(
+            step_id="init", data_schema=options_schema(self._entry.options)
+        )
+
+
 class CannotConnect(HomeAssistantError):
     """Error to indicate we cannot connect."""
 
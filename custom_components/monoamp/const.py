@@ -2,9 +2,51 @@
 
 DOMAIN = "mono_amp"
 
+AMP_PORT = 50230
+
 MAX_VOLUME_LIMIT = 80
 
+AMP_MAX_VOLUME = 38
+
 PROP_MAP = {"VO": "volume", "BL": "balance", "BS": "bass", "TR": "treble"}
 PROP_MAP_INV = {v: k for k, v in PROP_MAP.items()}
 
 PROP_MAX = {"VO": int(38 * (MAX_VOLUME_LIMIT / 100)), "BL": 20, "BS": 14, "TR": 14}
+
+CONF_MAX_CONCURRENCY = "max_concurrency"
+DEFAULT_MAX_CONCURRENCY = 4
+
+CONF_PIANOD_PUSH = "pianod_push"
+DEFAULT_PIANOD_PUSH = True
+
+CONF_PLAYLIST_TTL = "playlist_ttl"
+DEFAULT_PLAYLIST_TTL = 300
+
+CONF_WRITE_DEBOUNCE = "write_debounce"
+DEFAULT_WRITE_DEBOUNCE = 0.1
+
+CONF_POLL_BUDGET = "poll_budget"
+DEFAULT_POLL_BUDGET = 4
+
+CONF_POLL_INTERVAL = "poll_interval"
+DEFAULT_POLL_INTERVAL = 5
+
+CONF_IDLE_POLL_INTERVAL = "idle_poll_interval"
+DEFAULT_IDLE_POLL_INTERVAL = 30
+
+CONF_OFF_ZONE_POLL_INTERVAL = "off_zone_poll_interval"
+DEFAULT_OFF_ZONE_POLL_INTERVAL = 60
+
+CONF_FULL_SYNC_POLLS = "full_sync_polls"
+DEFAULT_FULL_SYNC_POLLS = 12
+
+# Keypads re-fetched per poll while AmpState reports no change
+KEYPAD_SAMPLE_SIZE = 1
+
+# Seconds without a command before polling slows to the idle interval
+IDLE_AFTER = 300
+# Seconds a commanded zone keeps being polled every cycle, even if off
+ZONE_ACTIVE_WINDOW = 60
+
+DATA_SCHEDULER = "scheduler"
+DEFAULT_MAX_TOTAL_REQUESTS = 8
@@ -0,0 +1,27 @@
+""" Diagnostics support for the MonoAmp integration """
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+TO_REDACT = {"host", "unique_id", "title"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "poll_interval": coordinator.poll_interval.total_seconds(),
+        "metrics": coordinator.gateway.metrics.as_dict(),
+        "breaker": coordinator.gateway.breaker.as_dict(),
+        "data": coordinator.data,
+    }
@@ -1,16 +1,21 @@
 """ The media_player implementation """
 
-import json
+from __future__ import annotations
+
+import asyncio
 import datetime as dt
+from functools import partial
 import logging
-import websocket
 
 import voluptuous as vol
-from homeassistant.core import HomeAssistant
+from homeassistant.const import ENTITY_MATCH_ALL
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.typing import StateType
 from homeassistant.components.media_player import (
     MediaPlayerEntity, BrowseMedia)
 from homeassistant.helpers import entity_platform, config_validation as cv
+from homeassistant.helpers.service import async_extract_entity_ids
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
 )
@@ -19,10 +24,16 @@ from homeassistant.components.media_player.const import (
     MediaPlayerEntityFeature, MediaPlayerState, MediaType
 )
 
-from homeassistant.util.json import json_loads
-
 from . import MonoAmpEntity
-from .const import DOMAIN, MAX_VOLUME_LIMIT
+from .const import (
+    CONF_PIANOD_PUSH,
+    DEFAULT_PIANOD_PUSH,
+    DOMAIN,
+    MAX_VOLUME_LIMIT,
+    PROP_MAX,
+)
+from .pianod import PianodError, PianodHub
+from .snapshot import SnapshotStore
 
 
 
@@ -35,6 +46,7 @@ SUPPORT_MONOAMP = (
     | MediaPlayerEntityFeature.SELECT_SOURCE
     | MediaPlayerEntityFeature.VOLUME_SET
     | MediaPlayerEntityFeature.VOLUME_STEP
+    | MediaPlayerEntityFeature.GROUPING
 )
 
 SUPPORT_PANDORA = (
@@ -45,6 +57,11 @@ SUPPORT_PANDORA = (
 )
 
 SERVICE_SET_ZONE = "set_zone"
+SERVICE_SNAPSHOT_ZONES = "snapshot_zones"
+SERVICE_RESTORE_ZONES = "restore_zones"
+
+# Keypad fields captured by snapshot_zones
+SNAPSHOT_FIELDS = ("PR", "CH", "VO", "MU", "BS", "TR", "BL")
 
 
 async def async_setup_entry(hass: HomeAssistant, config_entry, async_add_entities):
@@ -61,14 +78,23 @@ async def async_setup_entry(hass: HomeAssistant, config_entry, async_add_entitie
     #     entities.append(MonoAmpSwitch(coordinator, zone_num, enabled))
 
     async_add_entities(entities)
+    hass.data[DOMAIN][config_entry.entry_id]["zones"] = entities
 
     # Setup Pandora Entries
     entities = []
+    hub: PianodHub = hass.data[DOMAIN][config_entry.entry_id]["pianod"]
+    snapshot: SnapshotStore = hass.data[DOMAIN][config_entry.entry_id]["snapshot"]
 
-    room_list = await get_room_list(hass, config_entry)
+    room_list = snapshot.rooms
+    if room_list:
+        hass.async_create_task(async_refresh_room_list(hub, snapshot))
+    else:
+        room_list = await async_refresh_room_list(hub, snapshot)
+
+    push = config_entry.options.get(CONF_PIANOD_PUSH, DEFAULT_PIANOD_PUSH)
 
     for i in range(len(room_list)):
-        entities.append(PandoraZone(hass, config_entry, room_list, i + 1))
+        entities.append(PandoraZone(hass, hub, room_list, i + 1, push))
 
     async_add_entities(entities, True)
 
@@ -87,45 +113,121 @@ async def async_setup_entry(hass: HomeAssistant, config_entry, async_add_entitie
         "async_set_zone",
     )
 
+    # Snapshots span every amp, so these are domain services
+    for service in (SERVICE_SNAPSHOT_ZONES, SERVICE_RESTORE_ZONES):
+        if not hass.services.has_service(DOMAIN, service):
+            hass.services.async_register(
+                DOMAIN,
+                service,
+                partial(async_handle_zone_snapshot, hass),
+                schema=cv.make_entity_service_schema({}),
+            )
+
+
+async def async_handle_zone_snapshot(hass: HomeAssistant, call: ServiceCall) -> None:
+    """ Snapshots or restores the targeted zones, all zones if none is """
+    entity_ids = await async_extract_entity_ids(hass, call)
+    zones = [
+        zone
+        for zone in monoamp_zones(hass)
+        if not entity_ids
+        or ENTITY_MATCH_ALL in entity_ids
+        or zone.entity_id in entity_ids
+    ]
+
+    if call.service == SERVICE_SNAPSHOT_ZONES:
+        for zone in zones:
+            zone.snapshot()
+        return
+
+    results = await async_command_zone_values(
+        {zone: zone.restore_values() for zone in zones}, full_poll=True
+    )
+
+    failed = [zone.entity_id for zone, ok in results.items() if not ok]
+    if failed:
+        _LOGGER.warning("restore_zones: writes failed for %s", failed)
 
-async def get_room_list(hass: HomeAssistant, config_entry) -> list:
-    """ Returns room list from pandora """
-    url = f"ws://{config_entry.data['host']}:4446/pianod/?protocol=json"
-    tmp_socket:websocket.WebSocket = websocket.WebSocket()
 
-    await hass.async_add_executor_job(tmp_socket.connect, url)
+def monoamp_zones(hass: HomeAssistant) -> list[MonoAmpZone]:
+    """ Returns the zone entities of every loaded amp """
+    return [
+        zone
+        for entry_data in hass.data.get(DOMAIN, {}).values()
+        if isinstance(entry_data, dict)
+        for zone in entry_data.get("zones", [])
+    ]
+
+
+async def async_command_zone_values(values: dict, full_poll: bool = False) -> dict:
+    """ Writes values to zones of any amp concurrently
+
+    Zones are batched per amp. Each zone is confirmed by re-fetching its
+    keypad, or with full_poll each amp by a single poll at the end.
 
-    await hass.async_add_executor_job(tmp_socket.send, "ROOM LIST")
-    valid_data = False
+    Args:
+        values (dict): keypad fields to set keyed by MonoAmpZone
+        full_poll (bool, optional): confirm with one full poll per amp
 
-    while not valid_data:
-        socket_data = await hass.async_add_executor_job(tmp_socket.recv)
+    Returns:
+        dict: True per zone if all its writes succeeded
+    """
+    batches: dict = {}
+    for zone, zone_values in values.items():
+        if zone_values:
+            batches.setdefault(zone.coordinator, {})[zone.channel] = (zone, zone_values)
 
-        json_data = json_loads(socket_data)
-        if "code" in json_data:
-            if json_data["code"] == 203:
-                valid_data = True
+    results = await asyncio.gather(
+        *(
+            coordinator.async_command_zones(
+                {chan: zone_values for chan, (_, zone_values) in batch.items()},
+                full_poll=full_poll,
+            )
+            for coordinator, batch in batches.items()
+        )
+    )
 
-    await hass.async_add_executor_job(tmp_socket.close)
+    return {
+        batch[chan][0]: ok
+        for batch, result in zip(batches.values(), results)
+        for chan, ok in result.items()
+    }
 
-    ret = [item["room"] for item in json_data["data"]]
-    ret.reverse()
-    return ret
+
+async def async_refresh_room_list(hub: PianodHub, snapshot: SnapshotStore) -> list:
+    """ Fetches the pianod room list and stores it in the snapshot """
+    try:
+        room_list = await hub.async_room_list()
+    except PianodError as ex:
+        _LOGGER.warning("Could not get the Pandora room list: %s", ex)
+        return []
+
+    if room_list != snapshot.rooms:
+        if snapshot.rooms:
+            _LOGGER.info("Pandora rooms changed, reload the integration to apply")
+        snapshot.async_update(rooms=room_list)
+
+    return room_list
 
 
 class PandoraZone(MediaPlayerEntity):
-    """ Represents a Zone """
-    def __init__(self, hass: HomeAssistant, config_entry, room_list, index) -> None:
+    """ Represents a Zone
+
+        With push enabled the zone is not polled, it follows the event stream
+        of its room through the pianod hub instead.
+    """
+    def __init__(
+        self, hass: HomeAssistant, hub: PianodHub, room_list, index, push=True
+    ) -> None:
         super().__init__()
         self.hass: HomeAssistant = hass
         self.index: int = index
+        self._hub: PianodHub = hub
+        self._push: bool = push
         self._room_list: list = room_list
         self._room: str = self._room_list[index - 1]
-        self._room_data: str = ""
+        self._room_data: dict = {}
         self._last_updated: str = dt.datetime.now()
-        self._the_socket: websocket.WebSocket = None
-        self._url: str = f"ws://{config_entry.data['host']}:4446/pianod/?protocol=json"
-        self._playlist_list: str = ""
 
     @property
     def supported_features(self) -> int:
@@ -148,62 +250,41 @@ class PandoraZone(MediaPlayerEntity):
         """ Unimplemented method """
         return None
 
-    async def async_update(self):
-        """ Updates the current state of the zone """
-        the_socket = await self.get_socket()
-
-        try:
-            await self.hass.async_add_executor_job(the_socket.send, "PLAYLIST LIST")
+    @property
+    def should_poll(self) -> bool:
+        return not self._push
 
-            self._playlist_list = await self.recv_data(203)
+    async def async_added_to_hass(self) -> None:
+        """ Subscribe to room events when running in push mode """
+        await super().async_added_to_hass()
 
-            await self.hass.async_add_executor_job(
-                the_socket.send, f"ROOM ENTER {self._room_list[self.index - 1]}"
+        if self._push:
+            self.async_on_remove(
+                self._hub.async_subscribe(self._room, self._handle_room_update)
             )
-            self._room_data = await self.recv_data(200)
-            self._last_updated = dt.datetime.now()
-        except BrokenPipeError:
-            _LOGGER.info("BrokenPipeError:  websocket disconnected, scheduled reconnect")
-            await self.get_socket()
-        except json.decoder.JSONDecodeError:
-            _LOGGER.info("JSONDecodeError:  websocket disconnected, scheduled reconnect")
-            await self.get_socket()
-
-
-    async def recv_data(self, valid_code):
-        """ Get data from pandora """
-        the_socket = await self.get_socket()
-        valid_data = False
-
-        while not valid_data:
-            socket_data = await self.hass.async_add_executor_job(the_socket.recv)
-
-            json_data = json.loads(socket_data)
-            if "code" in json_data:
-                if json_data["code"] == valid_code:
-                    valid_data = True
 
-        return json_data
+    @callback
+    def _handle_room_update(self) -> None:
+        """ Handle a room state change reported by the hub """
+        self._room_data = self._hub.room_state.get(self._room, {})
+        self._last_updated = dt.datetime.now()
+        self.async_write_ha_state()
 
-    async def get_socket(self) -> websocket.WebSocket:
-        """ returns the associated socket """
-        if self._the_socket is None:
-            self._the_socket = await self.socket_connect()
-        if self._the_socket.connected is False:
-            self._the_socket = await self.socket_connect()
-
-        return self._the_socket
-
-    async def socket_connect(self) -> websocket.WebSocket:
-        """ connect the socket """
-        self._the_socket = websocket.WebSocket()
-
-        await self.hass.async_add_executor_job(self._the_socket.connect, self._url)
-        return self._the_socket
+    async def async_update(self):
+        """ Updates the current state of the zone """
+        try:
+            # Both go out back to back on the hub's connection
+            _, self._room_data = await asyncio.gather(
+                self._hub.async_playlists(),
+                self._hub.async_room_state(self._room),
+            )
+            self._last_updated = dt.datetime.now()
+        except PianodError as ex:
+            _LOGGER.info("PandoraZone %s: update failed, %s", self._room, ex)
 
     @property
     def source_list(self) -> list[str]:
-        return [item["name"] for item in self._playlist_list["data"]]
+        return self._hub.playlists
 
     @property
     def source(self):
@@ -214,7 +295,7 @@ class PandoraZone(MediaPlayerEntity):
 
     @property
     def state(self) -> str:
-        playback_state = self._room_data["state"]["playbackState"]
+        playback_state = self._room_data.get("state", {}).get("playbackState")
 
         if playback_state == "playing":
             return MediaPlayerState.PLAYING
@@ -303,20 +384,10 @@ class PandoraZone(MediaPlayerEntity):
 
     async def media_command(self, command):
         """ send a media command """
-        the_socket: websocket.WebSocket = await self.get_socket()
-
-        if the_socket.connected is False:
-            _LOGGER.error("Could not connect websocket")
-            return
-
         try:
-
-            await self.hass.async_add_executor_job(
-                the_socket.send, f"ROOM ENTER {self._room_list[self.index - 1]}"
-            )
-            await self.hass.async_add_executor_job(the_socket.send, f"{command}")
-        except BrokenPipeError:
-            _LOGGER.error("Socket was disconnected, will try to reconnect")
+            await self._hub.async_command(command, room=self._room)
+        except PianodError as ex:
+            _LOGGER.error("PandoraZone %s: %s", self._room, ex)
 
     def join_players(self, group_members: list[str]) -> None:
         raise NotImplementedError
@@ -328,11 +399,142 @@ class PandoraZone(MediaPlayerEntity):
 
 class MonoAmpZone(MonoAmpEntity, MediaPlayerEntity):
     """ Class that defines a MonoAmp Zone """
+    _watched_fields = ("Name", "PR", "CH", "VO", "MU", "stale")
+
     def __init__(self, coordinator, data_key, enabled):
         super().__init__(coordinator, data_key, enabled=enabled)
 
         self._receiver_max_volume = 38  #
         self._max_volume = MAX_VOLUME_LIMIT  # Percentage of max volume to allow
+        self._snapshot: dict | None = None
+        # Entity ids of the group, leader first, the list is shared by all
+        # of its members
+        self._group: list[str] = []
+
+    @property
+    def group_members(self) -> list[str]:
+        """ Returns the zones grouped with this one, leader first """
+        return list(self._group)
+
+    @property
+    def is_group_leader(self) -> bool:
+        """ Returns True if commands to this zone apply to its group """
+        return bool(self._group) and self._group[0] == self.entity_id
+
+    async def async_join_players(self, group_members: list[str]) -> None:
+        """ Groups zones with this one, which becomes the leader
+
+        Power, source, mute and volume changes sent to the leader are then
+        applied to every member.
+        """
+        zones = {zone.entity_id: zone for zone in monoamp_zones(self.hass)}
+        unknown = [eid for eid in group_members if eid not in zones]
+        if unknown:
+            raise HomeAssistantError(f"Not MonoAmp zones: {', '.join(unknown)}")
+
+        group = self._group if self.is_group_leader else [self.entity_id]
+        joining = [
+            zones[eid]
+            for eid in group_members
+            if eid not in group and eid != self.entity_id
+        ]
+
+        changed = {self.entity_id, *group}
+        for zone in [self, *joining]:
+            if zone._group is not group:
+                changed.update(zone._leave_group())
+        group.extend(zone.entity_id for zone in joining)
+        for zone in [self, *joining]:
+            zone._group = group
+
+        self._async_write_zones(changed | set(group))
+
+    async def async_unjoin_player(self) -> None:
+        """ Removes this zone from its group """
+        self._async_write_zones(self._leave_group())
+
+    async def async_will_remove_from_hass(self) -> None:
+        """ Leaves the group when the entity goes away """
+        changed = self._leave_group()
+        changed.discard(self.entity_id)
+        self._async_write_zones(changed)
+        await super().async_will_remove_from_hass()
+
+    def _leave_group(self) -> set[str]:
+        """ Removes this zone from its group, dissolving a group of one
+
+        Returns:
+            set: entity ids whose group membership changed
+        """
+        group, self._group = self._group, []
+        if self.entity_id not in group:
+            return {self.entity_id}
+
+        changed = set(group)
+        group.remove(self.entity_id)
+        if len(group) == 1:
+            for zone in self._group_zones(group):
+                zone._group = []
+            group.clear()
+
+        return changed
+
+    def _group_zones(self, entity_ids) -> list[MonoAmpZone]:
+        """ Returns the zone entities for entity ids, skipping unknown ones """
+        zones = {zone.entity_id: zone for zone in monoamp_zones(self.hass)}
+        return [zones[eid] for eid in entity_ids if eid in zones]
+
+    @callback
+    def _async_write_zones(self, entity_ids) -> None:
+        """ Writes the state of zones whose group changed """
+        for zone in self._group_zones(entity_ids):
+            if zone.hass is not None:
+                zone.async_write_ha_state()
+
+    async def _async_group_command(self, values_for) -> None:
+        """ Applies a command to every member of the group concurrently
+
+        Args:
+            values_for (Callable): returns the keypad fields to set for a
+                member, None if the command does not apply to it
+
+        Raises:
+            HomeAssistantError: listing the members the command failed for
+        """
+        members = self._group_zones(self._group)
+        values = {zone: values_for(zone) for zone in members}
+        results = await async_command_zone_values(values)
+
+        failed = [
+            zone.entity_id for zone in members if not results.get(zone, False)
+        ]
+        if failed:
+            raise HomeAssistantError(
+                f"Group command failed for {', '.join(failed)}"
+            )
+
+    def snapshot(self) -> None:
+        """ Captures the zone settings from the last poll, without a request """
+        keypad = self.keypad
+        if keypad is None:
+            self._snapshot = None
+            return
+
+        self._snapshot = {
+            key: keypad[key] for key in SNAPSHOT_FIELDS if key in keypad
+        }
+
+    def restore_values(self) -> dict:
+        """ Returns the snapshot values that differ from the current ones """
+        keypad = self.keypad
+        if self._snapshot is None or keypad is None:
+            return {}
+
+        return {
+            key: value
+            for key, value in self._snapshot.items()
+            if keypad.get(key) != value
+        }
 
     async def async_set_zone(
         self,
@@ -343,48 +545,58 @@ class MonoAmpZone(MonoAmpEntity, MediaPlayerEntity):
         mute_value=None,
     ):
         """ Sets the properties of a zone """
+        values = {}
+
         if treble_value is not None:
-            await self.hass.async_add_executor_job(
-                self.gateway.api_request,
-                "Value",
-                {"Channel": self.channel, "Property": "TR", "Value": treble_value},
-            )
+            values["TR"] = treble_value
 
         if bass_value is not None:
-            await self.hass.async_add_executor_job(
-                self.gateway.api_request,
-                "Value",
-                {"Channel": self.channel, "Property": "BS", "Value": bass_value},
-            )
+            values["BS"] = bass_value
 
         if balance_value is not None:
-            await self.hass.async_add_executor_job(
-                self.gateway.api_request,
-                "Value",
-                {"Channel": self.channel, "Property": "BL", "Value": balance_value},
-            )
+            values["BL"] = balance_value
 
         if volume_value is not None:
-            await self.async_set_volume_level(volume_value / 38)
+            values["VO"] = self._amp_volume(volume_value / 38)
 
         if mute_value is not None:
-            await self.async_mute_volume(mute_value)
+            values["MU"] = 1 if mute_value else 0
+
+        if not values:
+            return
+
+        channel = self.channel
+        await self.coordinator.async_command(
+            channel, values, self.gateway.async_set_values(channel, values)
+        )
 
     async def async_volume_up(self):
         """Send volume up command."""
-        await self.hass.async_add_executor_job(
-            self.gateway.api_request,
+        if self.is_group_leader:
+            return await self._async_group_command(
+                lambda zone: zone._volume_step_values(1)
+            )
+
+        self.coordinator.async_note_interaction(self.channel)
+        await self.gateway.api_request(
             "ValueUp",
             {"Channel": self.channel, "Property": "VO"},
         )
+        await self.coordinator.async_refresh_keypad(self.channel)
 
     async def async_volume_down(self):
         """Send volume up command."""
-        await self.hass.async_add_executor_job(
-            self.gateway.api_request,
+        if self.is_group_leader:
+            return await self._async_group_command(
+                lambda zone: zone._volume_step_values(-1)
+            )
+
+        self.coordinator.async_note_interaction(self.channel)
+        await self.gateway.api_request(
             "ValueDn",
             {"Channel": self.channel, "Property": "VO"},
         )
+        await self.coordinator.async_refresh_keypad(self.channel)
 
     async def async_mute_volume(self, mute):
         """Send mute command."""
@@ -393,58 +605,86 @@ class MonoAmpZone(MonoAmpEntity, MediaPlayerEntity):
         else:
             mute_val = 0
 
-        await self.hass.async_add_executor_job(
-            self.gateway.api_request,
-            "Value",
-            {"Channel": self.channel, "Property": "MU", "Value": mute_val},
+        if self.is_group_leader:
+            return await self._async_group_command(lambda zone: {"MU": mute_val})
+
+        await self.coordinator.async_command(
+            self.channel,
+            {"MU": mute_val},
+            self.gateway.api_request(
+                "Value",
+                {"Channel": self.channel, "Property": "MU", "Value": mute_val},
+            ),
         )
 
     async def async_set_volume_level(self, volume):
         """
         Set volume level, input is range 0..1.
         """
-        target_vol = int(volume * (self._max_volume / 100) * self._receiver_max_volume)
+        target_vol = self._amp_volume(volume)
+
+        if self.is_group_leader:
+            # Members keep their volume relative to the leader
+            state = self.zone_state
+            delta = target_vol - (state.volume if state is not None else 0)
+            return await self._async_group_command(
+                lambda zone: zone._volume_step_values(delta)
+            )
 
-        await self.hass.async_add_executor_job(
-            self.gateway.api_request,
-            "Value",
-            {"Channel": self.channel, "Property": "VO", "Value": target_vol},
+        await self.coordinator.async_command(
+            self.channel,
+            {"VO": target_vol},
+            self.gateway.async_set_value(self.channel, "VO", target_vol),
         )
 
+    def _volume_step_values(self, delta: int) -> dict | None:
+        """ Returns the values moving the zone volume by delta amp steps """
+        state = self.zone_state
+        if state is None:
+            return None
+
+        return {"VO": min(max(state.volume + delta, 0), PROP_MAX["VO"])}
+
+    def _amp_volume(self, volume) -> int:
+        """ Maps a 0..1 volume to the amp's volume scale """
+        return int(volume * (self._max_volume / 100) * self._receiver_max_volume)
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """ Flags a zone whose keypad missed the last poll """
+        state = self.zone_state
+        return {"stale": state.stale if state is not None else False}
+
     @property
     def is_volume_muted(self) -> bool:
-        return self.zone["MU"] == 1 if self.data_valid else False
+        state = self.zone_state
+        return state.mute if state is not None else False
 
     @property
     def source(self):
         """Return the current input source of the device."""
-        return (
-            self.coordinator.data["Sources"][self.zone["CH"] - 1]
-            if self.data_valid
-            else ""
-        )
+        state = self.zone_state
+        return state.source if state is not None else ""
 
     @property
     def source_list(self):
         """List of available input sources."""
-        # return list(filter(lambda i: "None" not in i, self.coordinator.data["Sources"]))
-        return (
-            [item for item in self.coordinator.data["Sources"] if "None" not in item]
-            if self.data_valid
-            else []
-        )
+        return self.coordinator.sources.names if self.data_valid else []
 
     @property
     def name(self):
-        return f"{self.zone['Name']} Zone" if self.data_valid else "--- Zone"
+        state = self.zone_state
+        return f"{state.name} Zone" if state is not None else "--- Zone"
 
     @property
     def volume_level(self) -> float:
-        return float(self.zone["VO"] / (38 * 0.8)) if self.data_valid else 0
+        state = self.zone_state
+        return state.volume_level if state is not None else 0
 
     @property
     def state(self) -> StateType:
-        if self.data_valid and self.zone["PR"] == 1:
+        state = self.zone_state
+        if state is not None and state.power:
             return MediaPlayerState.ON
 
         return MediaPlayerState.OFF
@@ -461,52 +701,48 @@ class MonoAmpZone(MonoAmpEntity, MediaPlayerEntity):
     @property
     def channel(self):
         """ Returns the channel, mapped from zone on MonoAmp """
-        return int(self.zone["ZN"]) - 11 if self.data_valid else 0
+        state = self.zone_state
+        return state.channel if state is not None else 0
 
     @property
     def zone(self):
         """ Returns the keypad from the zone data """
-        if (
-            self.coordinator.data is None
-            or len(self.coordinator.data) == 0
-            or len(self.coordinator.data["Keypads"]) == 0
-        ):
-            return None
-
-        try:
-            kp = [
-                kp
-                for kp in self.coordinator.data["Keypads"]
-                if kp["ZN"] == self._data_key
-            ]
-            return kp[0] if len(kp) > 0 else None
-        except IndexError:
-            _LOGGER.error("Index error in MonoAmpZone.zone")
-            return None
+        return self.keypad
 
     @property
     def is_on(self) -> bool:
         """ Returns True if zone is on """
-        return self.zone["PR"] == 1 if self.data_valid else False
+        state = self.zone_state
+        return state.power if state is not None else False
 
     @property
     def data_valid(self):
         """ Returns True if data is valid """
-        return True if self.zone is not None else False
+        return self.zone_state is not None
 
     async def async_select_source(self, source):
         """Set the input source."""
-        for i, value in enumerate(self.source_list):
-            if source == value:
-                return await self.hass.async_add_executor_job(
-                    self.gateway.api_request,
-                    "Value",
-                    {
-                        "Channel": self.channel,
-                        "Property": "CH",
-                        "Value": i + 1,
-                    },
-                )
+        if self.is_group_leader:
+            return await self._async_group_command(
+                lambda zone: zone._source_values(source)
+            )
+
+        source_index = self.coordinator.sources.channels.get(source)
+        if source_index is None:
+            return None
+
+        return await self.coordinator.async_command(
+            self.channel,
+            {"CH": source_index},
+            self.gateway.api_request(
+                "Value",
+                {
+                    "Channel": self.channel,
+                    "Property": "CH",
+                    "Value": source_index,
+                },
+            ),
+        )
 
     async def async_turn_on(self, **kwargs) -> None:
         """Send the ON command."""
@@ -522,20 +758,29 @@ class MonoAmpZone(MonoAmpEntity, MediaPlayerEntity):
 
         return await self._async_set_power("0")
 
+    def _source_values(self, source) -> dict | None:
+        """ Returns the values selecting a source by name on this zone's amp """
+        source_index = self.coordinator.sources.channels.get(source)
+        return None if source_index is None else {"CH": source_index}
+
     async def _async_set_power(self, zone_value) -> None:
+        if self.is_group_leader:
+            return await self._async_group_command(
+                lambda zone: {"PR": int(zone_value)}
+            )
 
-        await self.hass.async_add_executor_job(
-            self.gateway.api_request,
-            "Value",
-            {
-                "Channel": self.channel,
-                "Property": "PR",
-                "Value": zone_value,
-            },
+        await self.coordinator.async_command(
+            self.channel,
+            {"PR": int(zone_value)},
+            self.gateway.api_request(
+                "Value",
+                {
+                    "Channel": self.channel,
+                    "Property": "PR",
+                    "Value": zone_value,
+                },
+            ),
         )
 
-    def join_players(self, group_members: list[str]) -> None:
-        raise NotImplementedError
-
     def clear_playlist(self) -> None:
         raise NotImplementedError
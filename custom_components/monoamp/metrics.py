@@ -0,0 +1,123 @@
+""" Request and poll instrumentation for the MonoAmp gateway """
+from __future__ import annotations
+
+import bisect
+
+# Upper bounds of the latency histogram buckets, in milliseconds
+LATENCY_BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000)
+
+
+class LatencyStats:
+    """Counters and a latency histogram for one endpoint"""
+
+    def __init__(self) -> None:
+        self.requests: int = 0
+        self.errors: int = 0
+        self.timeouts: int = 0
+        self.total_ms: float = 0
+        self.max_ms: float = 0
+        self.last_ms: float = 0
+        self.buckets: list[int] = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def record(self, duration: float, error: bool = False, timeout: bool = False):
+        """Records one request
+
+        Args:
+            duration (float): duration in seconds
+            error (bool, optional): the request failed
+            timeout (bool, optional): the request timed out
+        """
+        duration_ms = duration * 1000
+        self.requests += 1
+        self.errors += error or timeout
+        self.timeouts += timeout
+        self.total_ms += duration_ms
+        self.last_ms = duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS_MS, duration_ms)] += 1
+
+    @property
+    def mean_ms(self) -> float:
+        """Returns the mean latency"""
+        return self.total_ms / self.requests if self.requests else 0
+
+    def as_dict(self) -> dict:
+        """Returns the stats in a JSON friendly form"""
+        labels = [f"le_{bound}" for bound in LATENCY_BUCKETS_MS] + ["inf"]
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "mean_ms": round(self.mean_ms, 1),
+            "max_ms": round(self.max_ms, 1),
+            "last_ms": round(self.last_ms, 1),
+            "histogram_ms": dict(zip(labels, self.buckets)),
+        }
+
+
+class GatewayMetrics:
+    """
+        class:  GatewayMetrics
+
+        Per-endpoint request stats plus poll cycle durations and overruns,
+        and the time requests spent waiting in the gateway's queue. Quiet
+        polls are those where AmpState was unchanged and keypads were only
+        sampled, a drift resync is a sampled keypad that changed anyway.
+    """
+    def __init__(self) -> None:
+        self.endpoints: dict[str, LatencyStats] = {}
+        self.poll = LatencyStats()
+        self.queue_wait = LatencyStats()
+        self.poll_overruns: int = 0
+        self.breaker_rejections: int = 0
+        self.deadline_misses: int = 0
+        self.quiet_polls: int = 0
+        self.keypads_skipped: int = 0
+        self.drift_resyncs: int = 0
+
+    def record_request(
+        self, endpoint: str, duration: float, error=False, timeout=False
+    ) -> None:
+        """Records an API request to an endpoint"""
+        stats = self.endpoints.get(endpoint)
+        if stats is None:
+            stats = self.endpoints[endpoint] = LatencyStats()
+
+        stats.record(duration, error=error, timeout=timeout)
+
+    def record_poll(self, duration: float, interval: float | None) -> None:
+        """Records a poll cycle, counting it as an overrun if it took longer
+        than the update interval"""
+        self.poll.record(duration)
+        if interval is not None and duration > interval:
+            self.poll_overruns += 1
+
+    def endpoint(self, endpoint: str) -> LatencyStats:
+        """Returns the stats of an endpoint, empty if it was never called"""
+        return self.endpoints.get(endpoint) or LatencyStats()
+
+    @property
+    def errors(self) -> int:
+        """Returns the number of failed requests over all endpoints"""
+        return sum(stats.errors for stats in self.endpoints.values())
+
+    @property
+    def timeouts(self) -> int:
+        """Returns the number of timed out requests over all endpoints"""
+        return sum(stats.timeouts for stats in self.endpoints.values())
+
+    def as_dict(self) -> dict:
+        """Returns the metrics in a JSON friendly form"""
+        return {
+            "endpoints": {
+                endpoint: stats.as_dict()
+                for endpoint, stats in sorted(self.endpoints.items())
+            },
+            "poll": {**self.poll.as_dict(), "overruns": self.poll_overruns},
+            "queue_wait": self.queue_wait.as_dict(),
+            "breaker_rejections": self.breaker_rejections,
+            "deadline_misses": self.deadline_misses,
+            "quiet_polls": self.quiet_polls,
+            "keypads_skipped": self.keypads_skipped,
+            "drift_resyncs": self.drift_resyncs,
+        }
@@ -0,0 +1,94 @@
+""" Parsed, immutable views of the MonoAmp keypad data """
+from __future__ import annotations
+
+from typing import NamedTuple
+
+from .const import AMP_MAX_VOLUME, MAX_VOLUME_LIMIT
+
+# Amp volume that maps to a volume_level of 1.0
+VOLUME_SCALE = AMP_MAX_VOLUME * (MAX_VOLUME_LIMIT / 100)
+
+
+class ZoneState(NamedTuple):
+    """The state of one zone, parsed once per refresh from its keypad"""
+
+    zone: int
+    channel: int
+    name: str
+    power: bool
+    mute: bool
+    volume: int
+    volume_level: float
+    bass: int
+    treble: int
+    balance: int
+    source_index: int
+    source: str
+    stale: bool
+
+    @classmethod
+    def from_keypad(cls, keypad: dict, sources: list) -> ZoneState:
+        """Parses a keypad
+
+        Args:
+            keypad (dict): the keypad as returned by the amp
+            sources (list): the Sources list of the AmpState
+
+        Returns:
+            ZoneState: the parsed state
+        """
+        source_index = keypad.get("CH", 0)
+        volume = keypad.get("VO", 0)
+
+        return cls(
+            zone=keypad["ZN"],
+            channel=int(keypad["ZN"]) - 11,
+            name=keypad.get("Name", ""),
+            power=keypad.get("PR") == 1,
+            mute=keypad.get("MU") == 1,
+            volume=volume,
+            volume_level=float(volume / VOLUME_SCALE),
+            bass=keypad.get("BS", 0),
+            treble=keypad.get("TR", 0),
+            balance=keypad.get("BL", 0),
+            source_index=source_index,
+            source=sources[source_index - 1]
+            if 0 < source_index <= len(sources)
+            else "",
+            stale=keypad.get("stale", False),
+        )
+
+
+class SourceList(NamedTuple):
+    """The selectable sources of an amp, filtered once per refresh"""
+
+    names: list
+    channels: dict
+
+    @classmethod
+    def from_sources(cls, sources: list) -> SourceList:
+        """Drops the unused "None" inputs and maps names to amp channels"""
+        channels = {
+            name: index + 1
+            for index, name in enumerate(sources)
+            if "None" not in name
+        }
+        return cls(names=list(channels), channels=channels)
+
+
+class AmpSnapshot(NamedTuple):
+    """Everything entities read about an amp, published as one reference
+
+    A new snapshot is built next to the current one on every refresh and
+    swapped in whole, so a reader never sees a half-updated amp.
+    """
+
+    data: dict | None
+    keypads: dict
+    zones: dict
+    sources: SourceList
+
+
+EMPTY_SNAPSHOT = AmpSnapshot(
+    data=None, keypads={}, zones={}, sources=SourceList.from_sources([])
+)
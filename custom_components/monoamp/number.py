@@ -26,7 +26,12 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
 class MonoAmpZoneValue(MonoAmpEntity, NumberEntity):
     """Represents the Value of Zone Property"""
     def __init__(self, coordinator, data_key, enabled, property_name):
-        super().__init__(coordinator, data_key, enabled=enabled)
+        super().__init__(
+            coordinator,
+            data_key,
+            enabled=enabled,
+            fields=("Name", "PR", PROP_MAP_INV[property_name]),
+        )
         self._attr_native_min_value = 0
         self._attr_native_max_value = PROP_MAX[PROP_MAP_INV[property_name]]
         self._attr_native_step = 1
@@ -35,33 +40,22 @@ class MonoAmpZoneValue(MonoAmpEntity, NumberEntity):
     @property
     def channel(self):
         """ Returns the channel mapped from the zone """
-        return int(self.zone["ZN"]) - 11 if self.data_valid else 0
+        state = self.zone_state
+        return state.channel if state is not None else 0
 
     @property
     def zone(self):
         """ Returns the zone corresponding to the object """
-        if (
-            self.coordinator.data is None
-            or len(self.coordinator.data) == 0
-            or len(self.coordinator.data["Keypads"]) == 0
-        ):
-            return None
-
-        kp = [
-            kp for kp in self.coordinator.data["Keypads"] if kp["ZN"] == self._data_key
-        ]
-        return kp[0] if len(kp) > 0 else None
+        return self.keypad
 
     async def async_set_native_value(self, value: float) -> None:
         _LOGGER.info("MonoAmpoZoneValue: Set %s", self.property_name)
-        await self.hass.async_add_executor_job(
-            self.gateway.api_request,
-            "Value",
-            {
-                "Channel": self.channel,
-                "Property": PROP_MAP_INV[self.property_name],
-                "Value": int(value),
-            },
+        prop = PROP_MAP_INV[self.property_name]
+
+        await self.coordinator.async_command(
+            self.channel,
+            {prop: int(value)},
+            self.gateway.async_set_value(self.channel, prop, int(value)),
         )
 
     def set_native_value(self, value: float) -> None:
@@ -69,9 +63,10 @@ class MonoAmpZoneValue(MonoAmpEntity, NumberEntity):
 
     @property
     def name(self) -> str:
+        state = self.zone_state
         return (
-            f"{self.zone['Name']} {self.property_name.capitalize()}"
-            if self.data_valid
+            f"{state.name} {self.property_name.capitalize()}"
+            if state is not None
             else f"----- {self.property_name.capitalize()}"
         )
 
@@ -81,13 +76,19 @@ class MonoAmpZoneValue(MonoAmpEntity, NumberEntity):
 
     @property
     def native_value(self) -> float:
-        return self.zone[PROP_MAP_INV[self.property_name]] if self.data_valid else 0
+        # ZoneState attributes are named after the property
+        state = self.zone_state
+        return getattr(state, self.property_name) if state is not None else 0
 
     @property
     def available(self) -> bool:
-        return self.zone["PR"] == 1 if self.data_valid else False
+        if not super().available:
+            return False
+
+        state = self.zone_state
+        return state.power if state is not None else False
 
     @property
     def data_valid(self):
         """ Returns True is data is valid """
-        return True if self.zone is not None else False
+        return self.zone_state is not None
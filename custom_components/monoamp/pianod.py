@@ -0,0 +1,538 @@
+""" Shared connection to the pianod server used by the Pandora rooms """
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Callable
+from functools import partial
+import logging
+import time
+
+import aiohttp
+
+from homeassistant.exceptions import HomeAssistantError
+
+from .const import DEFAULT_PLAYLIST_TTL
+
+_LOGGER = logging.getLogger(__name__)
+
+PIANOD_PORT = 4446
+
+COMMAND_TIMEOUT = 5
+RECONNECT_MIN_DELAY = 1
+RECONNECT_MAX_DELAY = 60
+
+# pianod reply codes, anything below CODE_SUCCESS is an unsolicited event
+CODE_SUCCESS = 200
+CODE_DATA = 203
+CODE_ERROR = 400
+
+# Keys of a pianod message that carry room state
+ROOM_STATE_KEYS = ("state", "currentSong")
+
+# Event code pianod sends when playlists are created, renamed or removed
+CODE_PLAYLISTS_CHANGED = 134
+
+
+class PianodError(HomeAssistantError):
+    """Error to indicate the pianod server could not be reached."""
+
+
+class _PendingReply:
+    """A command sent on a connection and still waiting for its reply"""
+
+    __slots__ = ("command", "expect", "future", "reply")
+
+    def __init__(self, command: str, expect: int, future: asyncio.Future) -> None:
+        self.command: str = command
+        self.expect: int = expect
+        self.future: asyncio.Future = future
+        # Data reply received ahead of the final status
+        self.reply: dict | None = None
+
+
+class PianodConnection:
+    """
+        class:  PianodConnection
+
+        One websocket to pianod. pianod answers commands in the order they
+        were sent, each with any data replies followed by a final status,
+        CODE_SUCCESS or an error. A reader task matches replies to the oldest
+        outstanding command and only moves on to the next at the final
+        status, so several commands can be in flight at once. Messages below
+        CODE_SUCCESS, and replies nobody is waiting for, are unsolicited
+        events and go to on_event.
+
+        A command that times out stays queued so the replies after it still
+        line up, its reply is dropped when it arrives. If nothing at all was
+        answered in that time the connection is closed.
+    """
+    def __init__(
+        self,
+        ws: aiohttp.ClientWebSocketResponse,
+        on_event: Callable[[dict], None] | None = None,
+        name: str = "pianod",
+    ) -> None:
+        self._ws: aiohttp.ClientWebSocketResponse = ws
+        self._on_event = on_event
+        self._pending: deque[_PendingReply] = deque()
+        self._send_lock = asyncio.Lock()
+        self._reader: asyncio.Task = asyncio.get_running_loop().create_task(
+            self._async_read(), name=f"{name} reader"
+        )
+
+    @classmethod
+    async def async_connect(
+        cls,
+        session: aiohttp.ClientSession,
+        url: str,
+        on_event: Callable[[dict], None] | None = None,
+        name: str = "pianod",
+    ) -> PianodConnection:
+        """Opens a websocket to pianod and starts reading it"""
+        ws = await session.ws_connect(url, timeout=COMMAND_TIMEOUT, heartbeat=30)
+        return cls(ws, on_event, name)
+
+    @property
+    def closed(self) -> bool:
+        """Returns True once the websocket closed or its reader stopped"""
+        return self._ws.closed or self._reader.done()
+
+    async def async_send(
+        self, command: str, expect: int = CODE_SUCCESS
+    ) -> asyncio.Future:
+        """Sends a command without waiting for its reply
+
+        Args:
+            command (str): the pianod command
+            expect (int, optional): code of the reply to return, the command
+                completes at its final status
+
+        Raises:
+            ConnectionError: the connection is closed
+
+        Returns:
+            asyncio.Future: resolves to the reply
+        """
+        async with self._send_lock:
+            if self.closed:
+                raise ConnectionError("pianod websocket closed")
+
+            pending = _PendingReply(
+                command, expect, asyncio.get_running_loop().create_future()
+            )
+            self._pending.append(pending)
+            try:
+                await self._ws.send_str(command)
+            except Exception:
+                self._pending.remove(pending)
+                raise
+
+        return pending.future
+
+    async def async_wait(
+        self, future: asyncio.Future, timeout: float = COMMAND_TIMEOUT
+    ) -> dict:
+        """Waits for the reply to a command sent with async_send
+
+        Raises:
+            asyncio.TimeoutError: no reply arrived in time
+            ConnectionError: the connection closed before the reply
+        """
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            if self._pending and self._pending[0].future is future:
+                await self.async_close()
+            raise
+
+    async def async_command(
+        self, command: str, expect: int = CODE_SUCCESS, timeout: float = COMMAND_TIMEOUT
+    ) -> dict:
+        """Sends a command and waits for its reply"""
+        return await self.async_wait(await self.async_send(command, expect), timeout)
+
+    async def async_wait_closed(self) -> None:
+        """Waits until the connection closes"""
+        await asyncio.wait({self._reader})
+
+    async def async_close(self) -> None:
+        """Closes the websocket, failing the commands still waiting"""
+        if not self._ws.closed:
+            await self._ws.close()
+        self._reader.cancel()
+        await asyncio.gather(self._reader, return_exceptions=True)
+
+    async def _async_read(self) -> None:
+        """Dispatches messages until the websocket closes"""
+        error = ConnectionError("pianod websocket closed")
+
+        try:
+            async for msg in self._ws:
+                if msg.type == aiohttp.WSMsgType.TEXT:
+                    try:
+                        json_data = msg.json()
+                    except ValueError:
+                        _LOGGER.debug("PianodHub: ignoring malformed %s", msg.data)
+                        continue
+                    self._dispatch(json_data)
+                elif msg.type == aiohttp.WSMsgType.ERROR:
+                    error = ConnectionError(f"pianod websocket failed: {msg.data}")
+                    break
+        except aiohttp.ClientError as ex:
+            error = ConnectionError(f"pianod websocket failed: {ex}")
+        finally:
+            while self._pending:
+                future = self._pending.popleft().future
+                if not future.done():
+                    future.set_exception(error)
+
+    def _dispatch(self, json_data) -> None:
+        """Routes a message to the oldest outstanding command or to on_event"""
+        code = json_data.get("code") if isinstance(json_data, dict) else None
+
+        if code is not None and code >= CODE_SUCCESS and self._pending:
+            head = self._pending[0]
+
+            if code == CODE_SUCCESS or code >= CODE_ERROR:
+                # The final status completes the head command, with the data
+                # reply it expected if one came first
+                self._pending.popleft()
+                if code >= CODE_ERROR:
+                    _LOGGER.warning(
+                        "PianodHub: error reply to %s: %s", head.command, json_data
+                    )
+                result = json_data
+                if code == CODE_SUCCESS and head.reply is not None:
+                    result = head.reply
+                if not head.future.done():
+                    head.future.set_result(result)
+            elif code == head.expect and head.reply is None:
+                head.reply = json_data
+            return
+
+        if self._on_event is not None:
+            self._on_event(json_data)
+
+
+class PianodHub:
+    """
+        class:  PianodHub
+
+        Owns the control connection to pianod for one config entry and
+        serves every Pandora room through it. Commands are pipelined on the
+        connection, only sending them is serialized, so ROOM ENTER and the
+        command for that room go out back to back and a slow reply does not
+        hold up the others. The connection is re-opened on demand with an
+        exponential backoff after it drops.
+
+        Rooms can also be subscribed to. Each subscribed room gets a listener
+        that stays entered in the room, consumes pianod's event stream and
+        calls back only when the room state changes.
+
+        The playlist catalog is the same for every room, so it is fetched once
+        and cached for playlist_ttl seconds or until pianod reports a playlist
+        change.
+    """
+    def __init__(
+        self,
+        host: str,
+        session: aiohttp.ClientSession,
+        playlist_ttl: float = DEFAULT_PLAYLIST_TTL,
+        port: int = PIANOD_PORT,
+    ) -> None:
+        self.host: str = host
+        self.url: str = f"ws://{host}:{port}/pianod/?protocol=json"
+        self._session: aiohttp.ClientSession = session
+        self._connection: PianodConnection | None = None
+        self._room: str | None = None
+        self._lock = asyncio.Lock()
+        self._reconnect_delay: float = RECONNECT_MIN_DELAY
+        self._retry_at: float = 0
+        self.room_state: dict[str, dict] = {}
+        self._subscribers: dict[str, list[Callable[[], None]]] = {}
+        self._listeners: dict[str, asyncio.Task] = {}
+        self.playlist_ttl: float = playlist_ttl
+        self.playlists: list[str] = []
+        self._playlists_expire: float = 0
+        self._playlist_lock = asyncio.Lock()
+        self._playlist_task: asyncio.Task | None = None
+
+    @property
+    def connected(self) -> bool:
+        """Returns True if the control connection is open"""
+        return self._connection is not None and not self._connection.closed
+
+    async def async_room_list(self) -> list:
+        """Returns the list of rooms known to pianod"""
+        json_data = await self.async_command("ROOM LIST", expect=CODE_DATA)
+
+        ret = [item["room"] for item in json_data.get("data", [])]
+        ret.reverse()
+        return ret
+
+    @property
+    def playlists_valid(self) -> bool:
+        """Returns True if the cached playlist names are still fresh"""
+        return time.monotonic() < self._playlists_expire
+
+    async def async_playlists(self) -> list[str]:
+        """Returns the playlist names, from the cache when it is fresh"""
+        async with self._playlist_lock:
+            if not self.playlists_valid:
+                json_data = await self.async_command("PLAYLIST LIST", expect=CODE_DATA)
+                self.playlists = [item["name"] for item in json_data.get("data", [])]
+                self._playlists_expire = time.monotonic() + self.playlist_ttl
+
+        return self.playlists
+
+    def async_invalidate_playlists(self) -> None:
+        """Drops the cached playlists and refetches them in the background"""
+        self._playlists_expire = 0
+
+        if self._playlist_task is None or self._playlist_task.done():
+            self._playlist_task = asyncio.get_running_loop().create_task(
+                self._async_refresh_playlists(), name="pianod playlists"
+            )
+
+    async def _async_refresh_playlists(self) -> None:
+        """Refetches the playlists and notifies every subscribed room"""
+        previous = self.playlists
+        try:
+            playlists = await self.async_playlists()
+        except PianodError as ex:
+            _LOGGER.debug("PianodHub: playlist refresh failed, %s", ex)
+            return
+
+        if playlists != previous:
+            for subscribers in list(self._subscribers.values()):
+                for update_callback in list(subscribers):
+                    update_callback()
+
+    async def async_room_state(self, room: str) -> dict:
+        """Enters a room and returns its state"""
+        json_data = (await self._async_pipeline([], room, enter=True))[0]
+
+        self.async_set_room_state(room, json_data)
+        return self.room_state.get(room, {})
+
+    async def async_command(
+        self, command: str, room: str | None = None, expect: int = CODE_SUCCESS
+    ) -> dict:
+        """Sends a command, optionally in a room, and waits for its reply
+
+        Args:
+            command (str): the pianod command
+            room (str, optional): room to enter before sending the command
+            expect (int, optional): code of the reply to return, the command
+                completes at its final status
+
+        Raises:
+            PianodError: the server is unreachable, did not reply in time or
+                replied with an error
+
+        Returns:
+            dict: the reply
+        """
+        return (await self._async_pipeline([(command, expect)], room))[-1]
+
+    def async_subscribe(self, room: str, update_callback: Callable[[], None]):
+        """Calls update_callback whenever pianod reports a change in a room
+
+        Returns:
+            Callable: removes the subscription
+        """
+        self._subscribers.setdefault(room, []).append(update_callback)
+
+        if room not in self._listeners:
+            self._listeners[room] = asyncio.get_running_loop().create_task(
+                self._async_listen(room), name=f"pianod listener {room}"
+            )
+
+        def remove_subscription() -> None:
+            subscribers = self._subscribers.get(room, [])
+            if update_callback in subscribers:
+                subscribers.remove(update_callback)
+            if not subscribers:
+                self._subscribers.pop(room, None)
+                task = self._listeners.pop(room, None)
+                if task is not None:
+                    task.cancel()
+
+        return remove_subscription
+
+    async def async_close(self) -> None:
+        """Closes the connection and stops the room listeners"""
+        listeners = list(self._listeners.values())
+        if self._playlist_task is not None:
+            listeners.append(self._playlist_task)
+            self._playlist_task = None
+        self._listeners.clear()
+        self._subscribers.clear()
+        for task in listeners:
+            task.cancel()
+        await asyncio.gather(*listeners, return_exceptions=True)
+
+        async with self._lock:
+            await self._async_disconnect()
+
+    async def _async_listen(self, room: str) -> None:
+        """Keeps a connection entered in a room and consumes its events"""
+        delay = RECONNECT_MIN_DELAY
+
+        while True:
+            try:
+                connection = await PianodConnection.async_connect(
+                    self._session,
+                    self.url,
+                    on_event=partial(self._handle_event, room),
+                    name=f"pianod listener {room}",
+                )
+                try:
+                    json_data = await connection.async_command(f"ROOM ENTER {room}")
+                    if json_data.get("code") != CODE_SUCCESS:
+                        raise PianodError(f"Could not enter {room}: {json_data}")
+                    delay = RECONNECT_MIN_DELAY
+                    # Playlist events may have been missed while disconnected
+                    self.async_invalidate_playlists()
+                    self.async_set_room_state(room, json_data)
+
+                    await connection.async_wait_closed()
+                finally:
+                    await connection.async_close()
+            except (
+                aiohttp.ClientError,
+                asyncio.TimeoutError,
+                OSError,
+                PianodError,
+            ) as ex:
+                _LOGGER.debug("PianodHub: listener for %s dropped, %s", room, ex)
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, RECONNECT_MAX_DELAY)
+
+    def _handle_event(self, room: str, json_data: dict) -> None:
+        """Merges an event into the room state and notifies on change"""
+        if not isinstance(json_data, dict):
+            return
+
+        if json_data.get("code") == CODE_PLAYLISTS_CHANGED or not self.playlists_valid:
+            self.async_invalidate_playlists()
+
+        self.async_set_room_state(room, json_data)
+
+    def _handle_control_event(self, json_data: dict) -> None:
+        """Handles an unsolicited message on the control connection"""
+        if not isinstance(json_data, dict):
+            return
+
+        if json_data.get("code") == CODE_PLAYLISTS_CHANGED:
+            self.async_invalidate_playlists()
+
+    def async_set_room_state(self, room: str, json_data: dict) -> None:
+        """Stores the state keys of a pianod message for a room"""
+        current = self.room_state.get(room, {})
+        updates = {
+            key: json_data[key]
+            for key in ROOM_STATE_KEYS
+            if key in json_data and current.get(key) != json_data[key]
+        }
+        if not updates:
+            return
+
+        self.room_state[room] = {**current, **updates}
+
+        for update_callback in list(self._subscribers.get(room, [])):
+            update_callback()
+
+    async def _async_pipeline(
+        self, commands: list[tuple[str, int]], room: str | None = None, enter=False
+    ) -> list[dict]:
+        """Sends commands back to back and waits for all their replies
+
+        Args:
+            commands (list): (command, expected reply code) pairs
+            room (str, optional): room to enter before the commands
+            enter (bool, optional): enter the room even if already in it
+
+        Raises:
+            PianodError: the server is unreachable, did not reply in time or
+                replied with an error
+
+        Returns:
+            list: the replies, starting with the one to ROOM ENTER if sent
+        """
+        for attempt in range(2):
+            async with self._lock:
+                connection = await self._async_connect()
+                entered = room is not None and (enter or room != self._room)
+
+                try:
+                    futures = []
+                    if entered:
+                        futures.append(
+                            await connection.async_send(f"ROOM ENTER {room}")
+                        )
+                        self._room = room
+                    for command, expect in commands:
+                        futures.append(await connection.async_send(command, expect))
+                except (aiohttp.ClientError, ConnectionError) as ex:
+                    _LOGGER.info("PianodHub: connection lost (%s), reconnecting", ex)
+                    await self._async_disconnect()
+                    if attempt:
+                        raise PianodError(f"pianod command failed: {commands}") from ex
+                    continue
+
+            try:
+                replies = await asyncio.gather(
+                    *(connection.async_wait(future) for future in futures)
+                )
+            except asyncio.TimeoutError as ex:
+                raise PianodError(f"pianod command timed out: {commands}") from ex
+            except ConnectionError as ex:
+                raise PianodError(f"pianod command failed: {commands}") from ex
+            finally:
+                for future in futures:
+                    future.cancel()
+
+            # Commands pipelined after a failed ROOM ENTER ran in no room
+            if entered and replies[0].get("code") != CODE_SUCCESS:
+                if self._room == room:
+                    self._room = None
+
+            for reply in replies:
+                if reply.get("code", 0) >= CODE_ERROR:
+                    raise PianodError(f"pianod error reply to {commands}: {reply}")
+
+            return replies
+
+        raise PianodError(f"pianod command failed: {commands}")
+
+    async def _async_connect(self) -> PianodConnection:
+        """Returns the open control connection, connecting if needed"""
+        if self.connected:
+            return self._connection
+
+        if time.monotonic() < self._retry_at:
+            raise PianodError("pianod is unreachable, waiting to reconnect")
+
+        try:
+            self._connection = await PianodConnection.async_connect(
+                self._session, self.url, on_event=self._handle_control_event
+            )
+        except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as ex:
+            self._retry_at = time.monotonic() + self._reconnect_delay
+            self._reconnect_delay = min(self._reconnect_delay * 2, RECONNECT_MAX_DELAY)
+            raise PianodError(f"Could not connect to {self.url}: {ex}") from ex
+
+        self._reconnect_delay = RECONNECT_MIN_DELAY
+        self._retry_at = 0
+        self._room = None
+        return self._connection
+
+    async def _async_disconnect(self) -> None:
+        """Closes the control connection"""
+        connection, self._connection = self._connection, None
+        self._room = None
+        if connection is not None:
+            await connection.async_close()
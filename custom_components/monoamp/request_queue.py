@@ -0,0 +1,135 @@
+""" Prioritized queue for the requests sent to one amp """
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+import heapq
+import itertools
+
+# Lower runs first
+PRIORITY_COMMAND = 0
+PRIORITY_REFRESH = 1
+PRIORITY_POLL = 2
+
+
+class _QueuedRequest:
+    """A request waiting for, or holding, a slot of the queue"""
+
+    __slots__ = ("priority", "key", "factory", "future", "waiters", "task")
+
+    def __init__(self, priority: int, key, factory, future: asyncio.Future) -> None:
+        self.priority: int = priority
+        self.key = key
+        self.factory: Callable[[], Awaitable] = factory
+        self.future: asyncio.Future = future
+        self.waiters: int = 0
+        self.task: asyncio.Task | None = None
+
+
+class RequestQueue:
+    """
+        class:  RequestQueue
+
+        Runs every request to an amp through at most `limit` slots. Waiting
+        requests are started by priority, so user commands overtake queued
+        polls. A read submitted with the key of one that is still waiting
+        shares it instead of queueing a second, equally fresh, request.
+    """
+    def __init__(self, limit: int) -> None:
+        self.limit: int = limit
+        self._heap: list = []
+        self._waiting: dict[Hashable, _QueuedRequest] = {}
+        self._running: int = 0
+        self._counter = itertools.count()
+
+    @property
+    def queued(self) -> int:
+        """Returns the number of requests waiting for a slot"""
+        return sum(1 for _, _, item in self._heap if item.task is None)
+
+    async def async_submit(
+        self,
+        factory: Callable[[], Awaitable],
+        priority: int = PRIORITY_COMMAND,
+        key: Hashable | None = None,
+    ):
+        """Queues a request and waits for its result
+
+        Args:
+            factory (Callable): creates the coroutine sending the request
+            priority (int, optional): one of the PRIORITY_ constants
+            key (Hashable, optional): identifies requests that can share a result
+
+        Returns:
+            the result of the request
+        """
+        item = self._waiting.get(key) if key is not None else None
+
+        if item is None:
+            item = _QueuedRequest(
+                priority, key, factory, asyncio.get_running_loop().create_future()
+            )
+            self._push(item)
+            if key is not None:
+                self._waiting[key] = item
+        elif priority < item.priority:
+            # Re-queue at the higher priority, the old heap entry is skipped
+            item.priority = priority
+            self._push(item)
+
+        item.waiters += 1
+        self._pump()
+
+        try:
+            return await asyncio.shield(item.future)
+        except asyncio.CancelledError:
+            item.waiters -= 1
+            if item.waiters == 0 and not item.future.done():
+                if item.task is None:
+                    self._drop(item)
+                else:
+                    item.task.cancel()
+            raise
+
+    def _push(self, item: _QueuedRequest) -> None:
+        """Adds an entry for the item to the heap"""
+        heapq.heappush(self._heap, (item.priority, next(self._counter), item))
+
+    def _drop(self, item: _QueuedRequest) -> None:
+        """Forgets a request nobody waits for anymore"""
+        item.future.cancel()
+        if item.key is not None and self._waiting.get(item.key) is item:
+            del self._waiting[item.key]
+
+    def _pump(self) -> None:
+        """Starts waiting requests while slots are free"""
+        loop = asyncio.get_running_loop()
+
+        while self._running < self.limit and self._heap:
+            _, _, item = heapq.heappop(self._heap)
+            if item.task is not None or item.future.done():
+                continue
+
+            # Once started, a new read must not reuse this result
+            if item.key is not None and self._waiting.get(item.key) is item:
+                del self._waiting[item.key]
+
+            self._running += 1
+            item.task = loop.create_task(self._async_run(item))
+
+    async def _async_run(self, item: _QueuedRequest) -> None:
+        """Runs a request and hands its result to the waiters"""
+        try:
+            result = await item.factory()
+        except asyncio.CancelledError:
+            if not item.future.done():
+                item.future.cancel()
+        except Exception as ex:  # pylint: disable=broad-except
+            if not item.future.done():
+                item.future.set_exception(ex)
+        else:
+            if not item.future.done():
+                item.future.set_result(result)
+        finally:
+            self._running -= 1
+            self._pump()
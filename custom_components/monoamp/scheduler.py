@@ -0,0 +1,121 @@
+""" Domain wide poll scheduler shared by every MonoAmp gateway """
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import logging
+import math
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DATA_SCHEDULER, DEFAULT_MAX_TOTAL_REQUESTS, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@callback
+def async_get_scheduler(hass: HomeAssistant) -> PollScheduler:
+    """Returns the scheduler of the domain, creating it on first use"""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_SCHEDULER not in domain_data:
+        domain_data[DATA_SCHEDULER] = PollScheduler(hass)
+
+    return domain_data[DATA_SCHEDULER]
+
+
+class PollScheduler:
+    """
+        class:  PollScheduler
+
+        Drives the polls of every registered coordinator. Each coordinator is
+        given a phase so the polls of several amps are spread evenly over the
+        interval instead of firing together, and polls stay locked to their
+        phase however long a single one takes. The total number of requests
+        in flight to all amps is capped by request_limiter.
+    """
+    def __init__(
+        self, hass: HomeAssistant, max_requests: int = DEFAULT_MAX_TOTAL_REQUESTS
+    ) -> None:
+        self.hass: HomeAssistant = hass
+        self.request_limiter = asyncio.Semaphore(max_requests)
+        self._anchor: float = hass.loop.time()
+        self._coordinators: list = []
+        self._timers: dict = {}
+        self._running: set = set()
+
+    @callback
+    def async_register(self, coordinator) -> Callable[[], None]:
+        """Starts polling a coordinator and re-spreads the phases
+
+        The coordinator provides async_refresh and a poll_interval timedelta,
+        which is re-read before every poll.
+
+        Returns:
+            Callable: stops polling the coordinator
+        """
+        self._coordinators.append(coordinator)
+        self._async_reschedule_all()
+
+        @callback
+        def unregister() -> None:
+            if coordinator in self._coordinators:
+                self._coordinators.remove(coordinator)
+            self._async_cancel(coordinator)
+            self._async_reschedule_all()
+
+        return unregister
+
+    @callback
+    def async_reschedule(self, coordinator) -> None:
+        """Re-times the next poll of a coordinator whose poll_interval changed"""
+        if coordinator in self._coordinators and coordinator not in self._running:
+            self._async_schedule(coordinator)
+
+    def phase(self, coordinator) -> float:
+        """Returns the phase of a coordinator as a fraction of its interval"""
+        return self._coordinators.index(coordinator) / len(self._coordinators)
+
+    @callback
+    def _async_reschedule_all(self) -> None:
+        """Reschedules every coordinator after the phases changed"""
+        for coordinator in self._coordinators:
+            self._async_schedule(coordinator)
+
+    @callback
+    def _async_schedule(self, coordinator) -> None:
+        """Schedules the next poll in the coordinator's phase slot"""
+        self._async_cancel(coordinator)
+
+        loop = self.hass.loop
+        interval = coordinator.poll_interval.total_seconds()
+        offset = self._anchor + self.phase(coordinator) * interval
+        slots = math.floor((loop.time() - offset) / interval) + 1
+
+        self._timers[coordinator] = loop.call_at(
+            offset + slots * interval, self._async_poll, coordinator
+        )
+
+    @callback
+    def _async_cancel(self, coordinator) -> None:
+        """Cancels a scheduled poll"""
+        timer = self._timers.pop(coordinator, None)
+        if timer is not None:
+            timer.cancel()
+
+    @callback
+    def _async_poll(self, coordinator) -> None:
+        """Runs a poll and schedules the next one once it is done"""
+        self._timers.pop(coordinator, None)
+        if coordinator in self._running:
+            return
+
+        async def poll() -> None:
+            try:
+                await coordinator.async_refresh()
+            finally:
+                self._running.discard(coordinator)
+                if coordinator in self._coordinators:
+                    self._async_schedule(coordinator)
+
+        self._running.add(coordinator)
+        self.hass.async_create_task(poll())
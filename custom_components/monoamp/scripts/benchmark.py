@@ -0,0 +1,230 @@
+""" Benchmarks for the MonoAmp integration, run against the local simulator
+
+Measures the coordinator poll cycle, the CPU cost of rendering entity state
+and the command round-trip time, and writes the results as JSON so runs can
+be compared between releases. Needs Home Assistant installed and the amp
+port (50230) free on localhost.
+
+    python custom_components/monoamp/scripts/benchmark.py --output bench.json
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import datetime as dt
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+)
+
+# pylint: disable=wrong-import-position
+import aiohttp  # noqa: E402
+from homeassistant.const import __version__ as HA_VERSION  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from custom_components.monoamp import (  # noqa: E402
+    MonoAmpDataUpdateCoordinator,
+    MonoAmpGateway,
+)
+from custom_components.monoamp.const import (  # noqa: E402
+    CONF_FULL_SYNC_POLLS,
+    CONF_OFF_ZONE_POLL_INTERVAL,
+    PROP_MAP_INV,
+)
+from custom_components.monoamp.media_player import MonoAmpZone  # noqa: E402
+from custom_components.monoamp.number import MonoAmpZoneValue  # noqa: E402
+from custom_components.monoamp.switch import MonoAmpSwitch  # noqa: E402
+from simulator import MonoAmpSimulator  # noqa: E402
+
+HOST = "127.0.0.1"
+
+# Fetch every keypad on every poll: the simulated zones are off and its
+# AmpState never changes, so adaptive polling would otherwise skip them all
+FULL_POLL_OPTIONS = {CONF_OFF_ZONE_POLL_INTERVAL: 0, CONF_FULL_SYNC_POLLS: 1}
+
+RENDERED_PROPERTIES = {
+    MonoAmpZone: (
+        "name",
+        "state",
+        "volume_level",
+        "is_volume_muted",
+        "source",
+        "source_list",
+    ),
+    MonoAmpZoneValue: ("name", "native_value", "available"),
+    MonoAmpSwitch: ("name", "is_on"),
+}
+
+
+def summarize(samples: list[float]) -> dict:
+    """Returns summary statistics in milliseconds"""
+    ordered = sorted(samples)
+    return {
+        "runs": len(ordered),
+        "mean_ms": statistics.fmean(ordered) * 1000,
+        "p50_ms": ordered[len(ordered) // 2] * 1000,
+        "p95_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000,
+        "max_ms": ordered[-1] * 1000,
+    }
+
+
+async def make_coordinator(hass, session, keypads: int):
+    """Builds a coordinator for the simulated amp and runs a first poll"""
+    entry = SimpleNamespace(
+        entry_id=f"benchmark_{keypads}",
+        data={"host": HOST},
+        options=FULL_POLL_OPTIONS,
+    )
+    coordinator = MonoAmpDataUpdateCoordinator(
+        hass,
+        gateway=MonoAmpGateway(
+            HOST, session, full_sync_polls=FULL_POLL_OPTIONS[CONF_FULL_SYNC_POLLS]
+        ),
+        config_entry=entry,
+        api_lock=asyncio.Lock(),
+    )
+    coordinator.data = await coordinator._async_update_data()
+    return coordinator
+
+
+async def bench_poll(hass, session, keypads: int, latency: float, rounds: int):
+    """(a) wall time of _async_update_data"""
+    simulator = MonoAmpSimulator(keypads=keypads, latency=latency, jitter=latency / 4)
+    await simulator.start(HOST)
+    try:
+        coordinator = await make_coordinator(hass, session, keypads)
+        first_poll = sum(simulator.request_count.values())
+        samples = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            coordinator.data = await coordinator._async_update_data()
+            samples.append(time.perf_counter() - start)
+        requests = sum(simulator.request_count.values()) - first_poll
+    finally:
+        await simulator.stop()
+
+    return {
+        "keypads": keypads,
+        "latency_s": latency,
+        "amp_requests_per_cycle": requests / rounds,
+        **summarize(samples),
+    }
+
+
+async def bench_render(hass, session, zones: int, rounds: int):
+    """(b) CPU time to render the state of every entity"""
+    simulator = MonoAmpSimulator(keypads=zones)
+    await simulator.start(HOST)
+    try:
+        coordinator = await make_coordinator(hass, session, zones)
+    finally:
+        await simulator.stop()
+
+    entities = []
+    for keypad in coordinator.data["Keypads"]:
+        entities.append(MonoAmpZone(coordinator, keypad["ZN"], True))
+        entities.append(MonoAmpSwitch(coordinator, keypad["ZN"], True))
+        for prop in PROP_MAP_INV:
+            entities.append(MonoAmpZoneValue(coordinator, keypad["ZN"], True, prop))
+
+    renders = [
+        (entity, RENDERED_PROPERTIES[type(entity)]) for entity in entities
+    ]
+
+    samples = []
+    for _ in range(rounds):
+        start = time.process_time()
+        for entity, properties in renders:
+            for prop in properties:
+                getattr(entity, prop)
+        samples.append(time.process_time() - start)
+
+    return {"zones": zones, "entities": len(entities), **summarize(samples)}
+
+
+async def bench_command(session, latency: float, rounds: int):
+    """(c) round-trip time of a single api_request command"""
+    simulator = MonoAmpSimulator(keypads=1, latency=latency)
+    await simulator.start(HOST)
+    try:
+        gateway = MonoAmpGateway(HOST, session)
+        samples = []
+        for i in range(rounds):
+            start = time.perf_counter()
+            await gateway.api_request(
+                "Value", {"Channel": 0, "Property": "VO", "Value": i % 30}
+            )
+            samples.append(time.perf_counter() - start)
+    finally:
+        await simulator.stop()
+
+    return {"latency_s": latency, **summarize(samples)}
+
+
+async def run(args) -> dict:
+    """Runs every benchmark and returns the results"""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        async with aiohttp.ClientSession() as session:
+            poll = [
+                await bench_poll(hass, session, keypads, latency, args.rounds)
+                for keypads in args.keypads
+                for latency in args.latency
+            ]
+            render = [
+                await bench_render(hass, session, zones, args.render_rounds)
+                for zones in args.zones
+            ]
+            command = [
+                await bench_command(session, latency, args.rounds)
+                for latency in args.latency
+            ]
+
+    with open(
+        os.path.join(os.path.dirname(__file__), "..", "manifest.json"),
+        encoding="utf-8",
+    ) as manifest:
+        version = json.load(manifest)["version"]
+
+    return {
+        "timestamp": dt.datetime.now(dt.timezone.utc).isoformat(),
+        "integration_version": version,
+        "homeassistant_version": HA_VERSION,
+        "python_version": platform.python_version(),
+        "poll_cycle": poll,
+        "render": render,
+        "command": command,
+    }
+
+
+def main() -> None:
+    """Parses arguments and writes the results"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--keypads", type=int, nargs="+", default=[6, 12, 24])
+    parser.add_argument("--latency", type=float, nargs="+", default=[0.0, 0.05, 0.2])
+    parser.add_argument("--zones", type=int, nargs="+", default=[6, 12, 24])
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--render-rounds", type=int, default=1000)
+    parser.add_argument("--output", help="JSON file, defaults to stdout")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump(results, output, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,325 @@
+""" Local stand-in for a MonoAmp gateway and its pianod server
+
+Serves the amp's HTTP API on :50230/api and a pianod compatible JSON
+websocket on :4446/pianod so the integration can be exercised without
+hardware. Keypad count, latency, jitter and failure rate are configurable
+to reproduce slow amps and large installs.
+
+    python simulator.py --keypads 12 --latency 0.2 --jitter 0.1 --failure-rate 0.05
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+
+from aiohttp import WSMsgType, web
+
+_LOGGER = logging.getLogger(__name__)
+
+AMP_PORT = 50230
+PIANOD_PORT = 4446
+
+PROP_LIMITS = {"PR": 1, "MU": 1, "VO": 38, "BS": 14, "TR": 14, "BL": 20}
+
+
+class MonoAmpSimulator:
+    """
+        class:  MonoAmpSimulator
+
+        Holds the simulated amp and pianod state and serves both protocols.
+    """
+    def __init__(
+        self,
+        keypads: int = 6,
+        sources: int = 6,
+        rooms: int = 2,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        failure_rate: float = 0.0,
+        serial: bool = True,
+        seed: int | None = None,
+        data_status: bool = True,
+    ) -> None:
+        self.latency: float = latency
+        self.jitter: float = jitter
+        self.failure_rate: float = failure_rate
+        self._random = random.Random(seed)
+        # pianod follows a data reply with a final status
+        self.data_status: bool = data_status
+        # The real amp handles one HTTP request at a time
+        self._amp_lock = asyncio.Lock() if serial else None
+        self.request_count: dict[str, int] = {}
+        # Keypads whose fetch always fails, e.g. a disconnected one
+        self.failing_keypads: set[int] = set()
+
+        self.sources: list[str] = [f"Source {i + 1}" for i in range(sources)]
+        self.sources += ["None"] * max(0, 6 - sources)
+        self.keypads: list[dict] = [
+            {
+                "ZN": 11 + chan,
+                "Name": f"Zone {chan + 1}",
+                "PR": 0,
+                "CH": 1,
+                "VO": 10,
+                "MU": 0,
+                "BS": 7,
+                "TR": 7,
+                "BL": 10,
+            }
+            for chan in range(keypads)
+        ]
+
+        self.playlists: list[str] = ["Quick Mix", "Jazz Radio", "Rock Radio"]
+        self.rooms: dict[str, dict] = {
+            f"Room {i + 1}": {
+                "state": {
+                    "playbackState": "paused",
+                    "selectedPlaylist": {"name": self.playlists[0]},
+                },
+                "currentSong": self._song(0),
+            }
+            for i in range(rooms)
+        }
+        self._room_sockets: dict[str, set] = {room: set() for room in self.rooms}
+        self._runners: list[web.AppRunner] = []
+        # The ports served on, known once started
+        self.amp_port: int | None = None
+        self.pianod_port: int | None = None
+
+    def amp_state(self) -> dict:
+        """Returns the AmpState payload"""
+        return {"KeypadCount": len(self.keypads), "Sources": self.sources}
+
+    async def start(
+        self, host: str = "127.0.0.1", amp_port=AMP_PORT, pianod_port=PIANOD_PORT
+    ) -> None:
+        """Starts serving both protocols, a port of 0 picks a free one"""
+        amp_app = web.Application()
+        amp_app.router.add_get("/api/{request_id}", self._handle_api)
+
+        pianod_app = web.Application()
+        pianod_app.router.add_get("/pianod/", self._handle_pianod)
+        pianod_app.router.add_get("/pianod", self._handle_pianod)
+
+        for app, port in ((amp_app, amp_port), (pianod_app, pianod_port)):
+            runner = web.AppRunner(app)
+            await runner.setup()
+            await web.TCPSite(runner, host, port).start()
+            self._runners.append(runner)
+
+        self.amp_port = self._runners[0].addresses[0][1]
+        self.pianod_port = self._runners[1].addresses[0][1]
+
+    async def stop(self) -> None:
+        """Stops serving"""
+        for runner in self._runners:
+            await runner.cleanup()
+        self._runners = []
+
+    async def _delay(self) -> None:
+        """Waits for the configured latency plus jitter"""
+        delay = self.latency + self._random.uniform(-self.jitter, self.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def _handle_api(self, request: web.Request) -> web.StreamResponse:
+        """Serves one amp API request"""
+        request_id = request.match_info["request_id"]
+        self.request_count[request_id] = self.request_count.get(request_id, 0) + 1
+
+        if self._amp_lock is None:
+            return await self._respond_api(request_id, request.query)
+
+        async with self._amp_lock:
+            return await self._respond_api(request_id, request.query)
+
+    async def _respond_api(self, request_id: str, query) -> web.StreamResponse:
+        """Builds the response for an amp API request"""
+        await self._delay()
+
+        if self._random.random() < self.failure_rate:
+            return web.Response(status=500, text="simulated failure")
+
+        try:
+            if request_id == "AmpState":
+                return web.json_response(self.amp_state())
+
+            if request_id == "keypad":
+                if int(query["chan"]) in self.failing_keypads:
+                    return web.Response(status=500, text="keypad not responding")
+                return web.json_response(self.keypads[int(query["chan"])])
+
+            if request_id in ("Value", "ValueUp", "ValueDn"):
+                keypad = self.keypads[int(query["Channel"])]
+                prop = query["Property"]
+                if request_id == "Value":
+                    value = int(query["Value"])
+                elif request_id == "ValueUp":
+                    value = keypad[prop] + 1
+                else:
+                    value = keypad[prop] - 1
+
+                low = 1 if prop == "CH" else 0
+                high = len(self.sources) if prop == "CH" else PROP_LIMITS[prop]
+                keypad[prop] = min(max(value, low), high)
+                return web.json_response(keypad)
+        except (KeyError, IndexError, ValueError) as ex:
+            return web.Response(status=400, text=str(ex))
+
+        return web.Response(status=404, text=f"unknown request {request_id}")
+
+    async def _handle_pianod(self, request: web.Request) -> web.WebSocketResponse:
+        """Serves one pianod websocket connection"""
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        room = None
+
+        try:
+            async for msg in ws:
+                if msg.type != WSMsgType.TEXT:
+                    continue
+
+                await self._delay()
+                room, reply = self._pianod_command(room, ws, msg.data.strip())
+                await ws.send_str(json.dumps(reply))
+                if reply.get("code") == 203 and self.data_status:
+                    await ws.send_str(json.dumps({"code": 200}))
+
+                if reply.get("code") == 200 and room is not None:
+                    await self._broadcast(room)
+        finally:
+            for sockets in self._room_sockets.values():
+                sockets.discard(ws)
+
+        return ws
+
+    def _pianod_command(self, room, ws, command: str) -> tuple[str | None, dict]:
+        """Runs a pianod command, returns the current room and the reply"""
+        words = command.split(" ", 2)
+        verb = " ".join(words[:2]).upper()
+
+        if verb == "ROOM LIST":
+            return room, {
+                "code": 203,
+                "data": [{"room": name} for name in self.rooms],
+            }
+
+        if verb == "ROOM ENTER":
+            name = command[len("ROOM ENTER "):]
+            if name not in self.rooms:
+                return room, {"code": 404, "error": f"no room {name}"}
+            if room is not None:
+                self._room_sockets[room].discard(ws)
+            self._room_sockets[name].add(ws)
+            return name, {"code": 200, **self.rooms[name]}
+
+        if verb == "PLAYLIST LIST":
+            return room, {
+                "code": 203,
+                "data": [{"name": name} for name in self.playlists],
+            }
+
+        if room is None:
+            return room, {"code": 400, "error": "not in a room"}
+
+        state = self.rooms[room]
+        upper = command.upper()
+        if upper in ("PLAY", "PAUSE", "STOP NOW"):
+            state["state"] = {
+                **state["state"],
+                "playbackState": "playing" if upper == "PLAY" else "paused",
+            }
+        elif upper == "SKIP":
+            state["currentSong"] = self._song(self._random.randrange(1000))
+        elif upper.startswith("SELECT PLAYLIST NAME "):
+            name = command[len("select playlist name "):].strip('"')
+            if name not in self.playlists:
+                return room, {"code": 404, "error": f"no playlist {name}"}
+            state["state"] = {**state["state"], "selectedPlaylist": {"name": name}}
+        else:
+            return room, {"code": 400, "error": f"unknown command {command}"}
+
+        return room, {"code": 200}
+
+    async def _broadcast(self, room: str) -> None:
+        """Sends the room state to every connection entered in it"""
+        event = json.dumps({"code": 101, **self.rooms[room]})
+        for ws in list(self._room_sockets[room]):
+            if not ws.closed:
+                await ws.send_str(event)
+
+    @staticmethod
+    def _song(number: int) -> dict:
+        """Returns a fake track"""
+        return {
+            "name": f"Track {number}",
+            "artistName": "Simulated Artist",
+            "albumName": "Simulated Album",
+            "albumArtUrl": "",
+            "duration": 180,
+            "timeIndex": 0,
+        }
+
+
+def main() -> None:
+    """Runs the simulator until interrupted"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--amp-port", type=int, default=AMP_PORT)
+    parser.add_argument("--pianod-port", type=int, default=PIANOD_PORT)
+    parser.add_argument("--keypads", type=int, default=6)
+    parser.add_argument("--sources", type=int, default=6)
+    parser.add_argument("--rooms", type=int, default=2)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="seconds")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="0..1")
+    parser.add_argument(
+        "--concurrent", action="store_true", help="serve amp requests in parallel"
+    )
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument(
+        "--no-data-status",
+        action="store_true",
+        help="send pianod data replies without the final 200 status",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    async def run() -> None:
+        simulator = MonoAmpSimulator(
+            keypads=args.keypads,
+            sources=args.sources,
+            rooms=args.rooms,
+            latency=args.latency,
+            jitter=args.jitter,
+            failure_rate=args.failure_rate,
+            serial=not args.concurrent,
+            seed=args.seed,
+            data_status=not args.no_data_status,
+        )
+        await simulator.start(args.host, args.amp_port, args.pianod_port)
+        _LOGGER.info(
+            "Simulating %d keypads on http://%s:%d/api, pianod on ws://%s:%d/pianod",
+            args.keypads,
+            args.host,
+            args.amp_port,
+            args.host,
+            args.pianod_port,
+        )
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await simulator.stop()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,24 @@
-import websocket
-import time
+import asyncio
+import sys
 
-def on_message(ws, message):
-    print(message)
-    print("******")
+import aiohttp
 
 
+async def main(url: str) -> None:
+    async with aiohttp.ClientSession() as session:
+        async with session.ws_connect(url) as ws:
+            await ws.send_str("ROOM LIST")
 
-url = "ws://192.168.2.128:4446/pianod/?protocol=json"
+            async for message in ws:
+                print(message.data)
+                print("******")
 
-ws = websocket.WebSocket(url)
 
-# time.sleep(2)
+# Defaults to a local simulator, see simulator.py
+host = sys.argv[1] if len(sys.argv) > 1 else "127.0.0.1"
+url = f"ws://{host}:4446/pianod/?protocol=json"
 
-ws.send("ROOM LIST")
-
-ws.run_forever()
\ No newline at end of file
+try:
+    asyncio.run(main(url))
+except KeyboardInterrupt:
+    pass
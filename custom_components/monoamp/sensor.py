@@ -0,0 +1,97 @@
+""" Diagnostic sensors exposing the MonoAmp gateway request metrics """
+import logging
+
+from homeassistant.components.sensor import SensorEntity, SensorStateClass
+from homeassistant.const import UnitOfTime
+from homeassistant.helpers.entity import EntityCategory
+
+from . import MonoAmpEntity
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# key: (name, unit, state class, value getter)
+METRIC_SENSORS = {
+    "poll_duration": (
+        "Poll Duration",
+        UnitOfTime.MILLISECONDS,
+        SensorStateClass.MEASUREMENT,
+        lambda metrics: round(metrics.poll.last_ms, 1),
+    ),
+    "poll_overruns": (
+        "Poll Overruns",
+        None,
+        SensorStateClass.TOTAL_INCREASING,
+        lambda metrics: metrics.poll_overruns,
+    ),
+    "quiet_polls": (
+        "Quiet Polls",
+        None,
+        SensorStateClass.TOTAL_INCREASING,
+        lambda metrics: metrics.quiet_polls,
+    ),
+    "request_errors": (
+        "Request Errors",
+        None,
+        SensorStateClass.TOTAL_INCREASING,
+        lambda metrics: metrics.errors,
+    ),
+    "request_timeouts": (
+        "Request Timeouts",
+        None,
+        SensorStateClass.TOTAL_INCREASING,
+        lambda metrics: metrics.timeouts,
+    ),
+    "ampstate_latency": (
+        "AmpState Latency",
+        UnitOfTime.MILLISECONDS,
+        SensorStateClass.MEASUREMENT,
+        lambda metrics: round(metrics.endpoint("AmpState").mean_ms, 1),
+    ),
+    "keypad_latency": (
+        "Keypad Latency",
+        UnitOfTime.MILLISECONDS,
+        SensorStateClass.MEASUREMENT,
+        lambda metrics: round(metrics.endpoint("keypad").mean_ms, 1),
+    ),
+    "value_latency": (
+        "Value Latency",
+        UnitOfTime.MILLISECONDS,
+        SensorStateClass.MEASUREMENT,
+        lambda metrics: round(metrics.endpoint("Value").mean_ms, 1),
+    ),
+}
+
+
+async def async_setup_entry(hass, config_entry, async_add_entities):
+    """Set up entry."""
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
+
+    async_add_entities(
+        MonoAmpMetricSensor(coordinator, metric) for metric in METRIC_SENSORS
+    )
+
+
+class MonoAmpMetricSensor(MonoAmpEntity, SensorEntity):
+    """Reports one gateway metric, disabled by default"""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    # Metrics change on every poll, not only when a keypad does
+    _watched_fields = None
+
+    def __init__(self, coordinator, metric):
+        super().__init__(coordinator, f"metrics_{metric}", enabled=False)
+        self._metric = metric
+        name, unit, state_class, self._getter = METRIC_SENSORS[metric]
+        self._attr_name = f"{self.gateway_name} {name}"
+        self._attr_native_unit_of_measurement = unit
+        self._attr_state_class = state_class
+
+    @property
+    def available(self) -> bool:
+        # Metrics are most useful while the amp is unreachable
+        return True
+
+    @property
+    def native_value(self):
+        return self._getter(self.gateway.metrics)
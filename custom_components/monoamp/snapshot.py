@@ -0,0 +1,47 @@
+""" Last known amp topology, kept in Home Assistant storage for fast startup """
+from __future__ import annotations
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 10
+
+
+class SnapshotStore:
+    """
+        class:  SnapshotStore
+
+        Holds the last good AmpState with its keypads and the pianod room
+        list of a config entry. Entities are created from it at startup while
+        live data is fetched in the background.
+    """
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}")
+        self._data: dict = {}
+
+    @property
+    def amp_state(self) -> dict | None:
+        """Returns the stored AmpState with its keypads"""
+        return self._data.get("amp_state")
+
+    @property
+    def rooms(self) -> list:
+        """Returns the stored pianod room list"""
+        return self._data.get("rooms", [])
+
+    async def async_load(self) -> None:
+        """Loads the snapshot from storage"""
+        self._data = await self._store.async_load() or {}
+
+    @callback
+    def async_update(self, **values) -> None:
+        """Updates parts of the snapshot, the write is delayed and batched"""
+        self._data.update(values)
+        self._store.async_delay_save(lambda: self._data, SAVE_DELAY)
+
+    async def async_remove(self) -> None:
+        """Removes the snapshot from storage"""
+        await self._store.async_remove()
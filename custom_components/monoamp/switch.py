@@ -28,30 +28,32 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
 class MonoAmpSwitch(MonoAmpEntity, SwitchEntity):
     """MonoAmp switch entity."""
 
+    _watched_fields = ("Name", "PR")
+
     @property
     def name(self):
         """Get the name of the switch."""
         # return f"{self.gateway_name} {self.circuit['name']}"
-        kp = self.circuit
-        if kp is not None:
-            return f"{self.circuit['Name']}"
+        state = self.zone_state
+        if state is not None:
+            return f"{state.name}"
         else:
             return "None"
 
     @property
     def channel(self):
         """ Returns channel mapped from zone """
-        return int(self.circuit["ZN"]) - 11
+        return self.zone_state.channel
 
     @property
     def source(self):
         """ Returns selected source for zone """
-        return int(self.circuit["CH"])
+        return self.zone_state.source_index
 
     @property
     def is_on(self) -> bool:
         """Get whether the switch is in on state."""
-        return self.circuit["PR"] == 1
+        return self.zone_state.power
 
     async def async_turn_on(self, **kwargs) -> None:
         """Send the ON command."""
@@ -71,14 +73,17 @@ class MonoAmpSwitch(MonoAmpEntity, SwitchEntity):
 
     async def _async_set_circuit(self, circuit_value) -> None:
 
-        ret = await self.hass.async_add_executor_job(
-            self.gateway.api_request,
-            "Value",
-            {
-                "Channel": self.channel,
-                "Property": "PR",
-                "Value": circuit_value,
-            },
+        ret = await self.coordinator.async_command(
+            self.channel,
+            {"PR": int(circuit_value)},
+            self.gateway.api_request(
+                "Value",
+                {
+                    "Channel": self.channel,
+                    "Property": "PR",
+                    "Value": circuit_value,
+                },
+            ),
         )
 
         _LOGGER.info("MonoAmpSwitch: %s", ret)
@@ -86,6 +91,4 @@ class MonoAmpSwitch(MonoAmpEntity, SwitchEntity):
     @property
     def circuit(self):
         """ Returns the data for the associated zone """
-        for kp in self.coordinator.data["Keypads"]:
-            if kp["ZN"] == self._data_key:
-                return kp
+        return self.keypad
@@ -0,0 +1,44 @@
+""" Fixtures running the integration against the in-process simulator """
+from __future__ import annotations
+
+import os
+import sys
+
+import aiohttp
+import pytest
+import pytest_asyncio
+
+sys.path.insert(
+    0,
+    os.path.join(
+        os.path.dirname(__file__), "..", "custom_components", "monoamp", "scripts"
+    ),
+)
+
+from simulator import MonoAmpSimulator  # noqa: E402
+
+HOST = "127.0.0.1"
+
+
+@pytest.fixture
+def simulator_options() -> dict:
+    """Options of the simulator, overridden by tests that need others"""
+    return {"keypads": 6, "seed": 1}
+
+
+@pytest_asyncio.fixture
+async def simulator(simulator_options):
+    """Serves a simulated amp and pianod on free ports"""
+    sim = MonoAmpSimulator(**simulator_options)
+    await sim.start(HOST, amp_port=0, pianod_port=0)
+    try:
+        yield sim
+    finally:
+        await sim.stop()
+
+
+@pytest_asyncio.fixture
+async def session():
+    """A client session closed after the test"""
+    async with aiohttp.ClientSession() as client:
+        yield client
@@ -0,0 +1,33 @@
+""" Tests of the coordinator's keypad bookkeeping """
+from custom_components.monoamp import MonoAmpDataUpdateCoordinator
+
+
+def test_diff_keypads_reports_changed_fields():
+    unchanged = {"ZN": 11, "VO": 10}
+    old = {11: unchanged, 12: {"ZN": 12, "VO": 10}, 13: {"ZN": 13}}
+    new = {11: unchanged, 12: {"ZN": 12, "VO": 12}, 14: {"ZN": 14}}
+
+    assert MonoAmpDataUpdateCoordinator._diff_keypads(old, new) == {
+        12: {"VO"},
+        13: None,
+        14: None,
+    }
+
+
+def test_equal_keypad_is_not_a_change():
+    old = {11: {"ZN": 11, "VO": 10}}
+    new = {11: {"ZN": 11, "VO": 10}}
+
+    assert MonoAmpDataUpdateCoordinator._diff_keypads(old, new) == {}
+
+
+def test_context_changed():
+    changed = {11: {"VO"}, 12: None}
+    context_changed = MonoAmpDataUpdateCoordinator._context_changed
+
+    assert context_changed(None, changed)
+    assert context_changed((11, ("VO", "MU")), changed)
+    assert not context_changed((11, ("MU",)), changed)
+    assert context_changed((11, ()), changed)
+    assert context_changed((12, ("MU",)), changed)
+    assert not context_changed((13, ()), changed)
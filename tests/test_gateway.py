@@ -0,0 +1,72 @@
+""" Tests of MonoAmpGateway polls and writes against the simulator """
+import asyncio
+import time
+
+import pytest
+import pytest_asyncio
+
+from custom_components.monoamp import MonoAmpGateway
+
+from .conftest import HOST
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest_asyncio.fixture
+async def gateway(simulator, session):
+    """A gateway polling the simulator"""
+    return MonoAmpGateway(HOST, session, write_debounce=0, port=simulator.amp_port)
+
+
+async def test_full_poll_fetches_every_keypad(simulator, gateway):
+    fetched = await gateway.update()
+
+    assert fetched == set(range(6))
+    assert gateway.amp_state["Keypads"] == simulator.keypads
+    assert simulator.request_count["keypad"] == 6
+
+
+@pytest.mark.parametrize(
+    "simulator_options", [{"keypads": 6, "latency": 0.1, "serial": False}]
+)
+async def test_keypads_are_fetched_concurrently(simulator, gateway):
+    start = time.monotonic()
+    await gateway.update()
+
+    # AmpState, then the keypads max_concurrency at a time
+    assert time.monotonic() - start < 0.1 * 4
+
+
+async def test_write_burst_is_coalesced(simulator, gateway):
+    gateway.write_debounce = 0.05
+
+    results = await asyncio.gather(
+        *(gateway.async_set_value(0, "VO", value) for value in range(10, 20))
+    )
+
+    assert simulator.request_count["Value"] == 1
+    assert simulator.keypads[0]["VO"] == 19
+    assert all(result == results[0] for result in results)
+
+
+async def test_writes_to_other_properties_are_not_merged(simulator, gateway):
+    await gateway.async_set_values(0, {"VO": 20, "BS": 3})
+    await gateway.async_set_value(1, "VO", 21)
+
+    assert simulator.request_count["Value"] == 3
+    assert simulator.keypads[0]["VO"] == 20
+    assert simulator.keypads[0]["BS"] == 3
+    assert simulator.keypads[1]["VO"] == 21
+
+
+async def test_close_cancels_queued_writes(simulator, gateway):
+    gateway.write_debounce = 10
+
+    write = asyncio.ensure_future(gateway.async_set_value(0, "VO", 30))
+    await asyncio.sleep(0)
+    await gateway.async_close()
+
+    with pytest.raises(asyncio.CancelledError):
+        await write
+    assert "Value" not in simulator.request_count
+    assert not gateway._write_tasks
@@ -0,0 +1,62 @@
+""" Tests of the simulator the other tests run against """
+import pytest
+
+from .conftest import HOST
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _get(session, simulator, request_id, **params):
+    """Sends one amp API request to the simulator"""
+    async with session.get(
+        f"http://{HOST}:{simulator.amp_port}/api/{request_id}",
+        params={key: str(value) for key, value in params.items()},
+    ) as response:
+        return response.status, await response.json(content_type=None)
+
+
+async def test_serves_amp_state_and_keypads(simulator, session):
+    assert await _get(session, simulator, "AmpState") == (
+        200,
+        simulator.amp_state(),
+    )
+    assert await _get(session, simulator, "keypad", chan=5) == (
+        200,
+        simulator.keypads[5],
+    )
+    assert simulator.request_count == {"AmpState": 1, "keypad": 1}
+
+
+async def test_values_are_clamped(simulator, session):
+    status, keypad = await _get(
+        session, simulator, "Value", Channel=0, Property="VO", Value=99
+    )
+
+    assert status == 200
+    assert keypad["VO"] == simulator.keypads[0]["VO"] == 38
+
+    _, keypad = await _get(session, simulator, "ValueUp", Channel=0, Property="VO")
+    assert keypad["VO"] == 38
+
+
+async def test_failing_keypad(simulator, session):
+    simulator.failing_keypads.add(2)
+
+    async with session.get(
+        f"http://{HOST}:{simulator.amp_port}/api/keypad", params={"chan": "2"}
+    ) as response:
+        assert response.status == 500
+
+
+async def test_pianod_data_reply_ends_with_status(simulator, session):
+    async with session.ws_connect(
+        f"ws://{HOST}:{simulator.pianod_port}/pianod/?protocol=json"
+    ) as ws:
+        await ws.send_str("PLAYLIST LIST")
+
+        data = await ws.receive_json()
+        status = await ws.receive_json()
+
+    assert data["code"] == 203
+    assert [item["name"] for item in data["data"]] == simulator.playlists
+    assert status == {"code": 200}